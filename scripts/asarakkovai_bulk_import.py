@@ -15,6 +15,7 @@ import csv
 import io
 import sys
 from word_cleaning import split_and_clean_words
+from search_index import refresh_work_search_index
 
 
 class AsarakkovaiBulkImporter:
@@ -233,6 +234,9 @@ class AsarakkovaiBulkImporter:
         self._bulk_copy('words', self.words,
                        ['word_id', 'line_id', 'word_position', 'word_text', 'sandhi_split'])
 
+        # Refresh derived search tables (word_occurrences) for this work
+        refresh_work_search_index(self.cursor, self.work_id)
+
         self.conn.commit()
         print("[OK] Phase 2 complete: All data inserted")
 
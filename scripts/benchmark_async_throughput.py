@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: sync (psycopg2 threadpool) vs async (psycopg 3) API throughput
+
+Runs the same /search mix against two running API servers - one started with
+DB_DRIVER=sync and one with DB_DRIVER=async - at each concurrency level for
+--duration seconds, and reports requests/second and latency percentiles.
+
+Usage:
+    python benchmark_async_throughput.py <sync_url> <async_url> [--levels 50,200,500] [--duration 30]
+
+Example:
+    DB_DRIVER=sync  uvicorn main:app --port 8000
+    DB_DRIVER=async uvicorn main:app --port 8001
+    python benchmark_async_throughput.py http://localhost:8000 http://localhost:8001
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmark_utils import print_table, summarize
+
+WORDS = ['அறம்', 'பொருள்', 'இன்பம்', 'உலகு', 'மழை', 'அன்பு', 'கண்', 'நீர்']
+
+
+def get_option(name, default):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def run_level(api_url, clients, duration):
+    """Keep `clients` threads issuing /search requests for `duration` seconds"""
+    latencies = []
+    statuses = Counter()
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(clients)
+    deadline = [0.0]
+
+    def client(client_id):
+        session = requests.Session()
+        if start_barrier.wait() == 0:
+            deadline[0] = time.perf_counter() + duration
+        start_barrier.wait()  # deadline is set once every client is ready
+        i = 0
+        while time.perf_counter() < deadline[0]:
+            word = WORDS[(client_id + i) % len(WORDS)]
+            params = {'q': word, 'match_type': 'exact', 'limit': 100, 'sort_by': 'canonical'}
+            start = time.perf_counter()
+            try:
+                status = session.get(f"{api_url}/search", params=params, timeout=60).status_code
+            except requests.RequestException:
+                status = 'error'
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with lock:
+                latencies.append(elapsed_ms)
+                statuses[status] += 1
+            i += 1
+
+    run_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        list(executor.map(client, range(clients)))
+    run_seconds = time.perf_counter() - run_start
+
+    ok = statuses.get(200, 0)
+    return {
+        'rps': ok / run_seconds if run_seconds else 0.0,
+        'errors': sum(statuses.values()) - ok,
+        **summarize(latencies),
+    }
+
+
+def main():
+    urls = [arg for arg in sys.argv[1:3] if not arg.startswith('--')]
+    if len(urls) != 2:
+        print(__doc__)
+        sys.exit(1)
+    levels = [int(level) for level in get_option('--levels', '50,200,500').split(',')]
+    duration = float(get_option('--duration', '30'))
+
+    print("=" * 70)
+    print(f"Throughput: sync vs async driver, {duration:.0f}s per level")
+    print(f"sync:  {urls[0]}")
+    print(f"async: {urls[1]}")
+    print("=" * 70)
+
+    rows = []
+    for clients in levels:
+        for label, api_url in zip(('sync', 'async'), urls):
+            requests.get(f"{api_url}/search", params={'q': WORDS[0]}, timeout=60)  # Warm up
+            stats = run_level(api_url, clients, duration)
+            rows.append([
+                clients, label, f"{stats['rps']:.0f}", f"{stats['p50']:.1f}",
+                f"{stats['p95']:.1f}", f"{stats['max']:.1f}", stats['errors']
+            ])
+
+    print_table(['clients', 'driver', 'req/s', 'p50 ms', 'p95 ms', 'max ms', 'errors'], rows)
+
+
+if __name__ == '__main__':
+    main()
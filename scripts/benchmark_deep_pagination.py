@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark deep pages of /search: OFFSET pagination vs cursor (keyset) pagination
+
+Walks every page of a common word once to collect the cursor for each page,
+then times fetching selected pages both ways:
+  offset: search_words(..., offset=page * limit)
+  cursor: search_words(..., cursor=<next_cursor of the previous page>)
+
+Usage:
+    python benchmark_deep_pagination.py [database_url] [--word அறம்] [--sort canonical] [--repeat N]
+
+Requires migrations/008_add_sort_ranks.sql to be applied.
+"""
+
+import sys
+
+from benchmark_utils import (
+    add_backend_to_path, get_connection_string, print_table, summarize, time_calls
+)
+
+PAGE_SIZE = 100
+
+
+def get_option(name, default):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def main():
+    connection_string = get_connection_string()
+    word = get_option('--word', 'அறம்')
+    sort_by = get_option('--sort', 'canonical')
+    repeat = int(get_option('--repeat', '10'))
+
+    add_backend_to_path()
+    from database import Database
+    db = Database(connection_string)
+
+    def fetch(offset=0, cursor=None):
+        return db.search_words(word, match_type='exact', limit=PAGE_SIZE,
+                               offset=offset, sort_by=sort_by, cursor=cursor)
+
+    print("=" * 70)
+    print(f"Deep pagination benchmark: '{word}' (exact, sort_by={sort_by})")
+    print("=" * 70)
+
+    # Collect the cursor that leads to each page
+    cursors = [None]
+    first_page = fetch()
+    total = first_page['total_count']
+    next_cursor = first_page['next_cursor']
+    while next_cursor:
+        cursors.append(next_cursor)
+        next_cursor = fetch(cursor=next_cursor)['next_cursor']
+
+    page_count = len(cursors)
+    print(f"{total} occurrences, {page_count} pages of {PAGE_SIZE}")
+    print(f"Repeat: {repeat} runs per page (after 2 warmup runs)\n")
+
+    # First, middle and last pages plus a few fixed depths
+    pages = sorted({p for p in (0, 10, 50, page_count // 2, page_count - 1) if 0 <= p < page_count})
+
+    rows = []
+    for page in pages:
+        by_offset = fetch(offset=page * PAGE_SIZE)['results']
+        by_cursor = fetch(cursor=cursors[page])['results']
+        if [r['word_id'] for r in by_offset] != [r['word_id'] for r in by_cursor]:
+            print(f"✗ Page {page}: offset and cursor pages differ")
+
+        offset_stats = summarize(time_calls(lambda: fetch(offset=page * PAGE_SIZE), repeat))
+        cursor_stats = summarize(time_calls(lambda: fetch(cursor=cursors[page]), repeat))
+
+        rows.append([
+            page, page * PAGE_SIZE,
+            f"{offset_stats['p50']:.1f}", f"{offset_stats['p95']:.1f}",
+            f"{cursor_stats['p50']:.1f}", f"{cursor_stats['p95']:.1f}",
+        ])
+
+    print_table(
+        ['page', 'row offset', 'offset p50', 'offset p95', 'cursor p50', 'cursor p95'],
+        rows
+    )
+    print("\nAll times in milliseconds (full search_words call, including unique_words).")
+
+    db.close_all_connections()
+
+
+if __name__ == '__main__':
+    main()
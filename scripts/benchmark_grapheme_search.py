@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark single-letter searches: match_type=partial against match_type=grapheme
+
+For each letter, /search/summary is run both ways (word_position=beginning by
+default) and the table shows how many distinct words and occurrences each
+matches, plus the p50/p95 of the call. A partial 'க' also matches every word
+starting with கா, கி, க் ...; grapheme counts only words whose first letter is க.
+EXPLAIN (ANALYZE, BUFFERS) of the grapheme summary query is printed for the first
+letter.
+
+Usage:
+    python benchmark_grapheme_search.py [database_url] [--letters க,ம,அ,த] [--position beginning] [--repeat N]
+"""
+
+import sys
+
+from benchmark_utils import (
+    add_backend_to_path, get_connection_string, print_table, summarize, time_calls
+)
+
+
+def get_option(name, default):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def main():
+    connection_string = get_connection_string()
+    letters = get_option('--letters', 'க,ம,அ,த,ப,ச').split(',')
+    position = get_option('--position', 'beginning')
+    repeat = int(get_option('--repeat', '10'))
+
+    add_backend_to_path()
+    from database import Database
+    db = Database(connection_string)
+
+    print("=" * 70)
+    print(f"Single-letter search benchmark: partial vs grapheme (word_position={position})")
+    print("=" * 70)
+    print(f"Repeat: {repeat} runs per query (after 2 warmup runs, summary cache cleared)\n")
+
+    with db.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) FROM word_graphemes")
+            if cur.fetchone()[0] == 0:
+                print("word_graphemes is empty: run python scripts/search_index.py --graphemes")
+                sys.exit(1)
+
+            filter_where, filter_params = db._build_search_filters(letters[0], 'grapheme', position)
+            summary_query, summary_params = db._build_word_summary_query(filter_where, filter_params)
+            print(f"--- EXPLAIN ANALYZE grapheme summary '{letters[0]}' ---")
+            cur.execute(f"EXPLAIN (ANALYZE, BUFFERS) {summary_query}", summary_params)
+            for (line,) in cur.fetchall():
+                print(line)
+            print()
+
+    rows = []
+    for letter in letters:
+        for match_type in ('partial', 'grapheme'):
+            def run(match_type=match_type):
+                db.unique_words_cache.clear()
+                db.count_cache.clear()
+                return db.search_summary(letter, match_type=match_type, word_position=position)
+
+            result = run()
+            timing = summarize(time_calls(run, repeat))
+            rows.append([
+                letter, match_type, len(result['unique_words']), result['total_count'],
+                f"{timing['p50']:.2f}", f"{timing['p95']:.2f}",
+            ])
+
+    print_table(['letter', 'match', 'words', 'occurrences', 'p50 ms', 'p95 ms'], rows)
+    print("\nAll times in milliseconds (whole search_summary call, caches cleared).")
+
+    db.close_all_connections()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark /search serialization time and bytes on the wire for a large page
+
+Fetches one /search page (default limit 500) through Database.search_words and
+times turning it into response bytes two ways:
+  fastapi: SearchResponse validation + jsonable_encoder + json.dumps (the default
+           JSONResponse path the endpoint used before)
+  orjson:  orjson.dumps of the same dict (main.fast_json_response)
+then reports the body size uncompressed, gzip and brotli (if installed), and the
+time to compress it.
+
+Usage:
+    python benchmark_response_serialization.py [database_url] [--word அறம்] [--limit 500] [--repeat N]
+"""
+
+import json
+import os
+import sys
+import zlib
+
+from benchmark_utils import (
+    add_backend_to_path, get_connection_string, print_table, summarize, time_calls
+)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def get_option(name, default):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def gzip_bytes(data, level=6):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    return compressor.compress(data) + compressor.flush()
+
+
+def main():
+    connection_string = get_connection_string()
+    word = get_option('--word', 'அறம்')
+    limit = int(get_option('--limit', '500'))
+    repeat = int(get_option('--repeat', '20'))
+
+    # main.py builds its Database from DATABASE_URL at import
+    os.environ['DATABASE_URL'] = connection_string
+    add_backend_to_path()
+    import orjson
+    from fastapi.encoders import jsonable_encoder
+    from main import SearchResponse, db
+
+    results = db.search_words(word, match_type='partial', word_position='beginning', limit=limit)
+    results.pop('timings', None)
+
+    print("=" * 70)
+    print(f"/search serialization benchmark: '{word}' (partial, limit={limit})")
+    print("=" * 70)
+    print(f"{len(results['results'])} result rows, {len(results['unique_words'])} unique words")
+    print(f"Repeat: {repeat} runs per method (after 2 warmup runs)\n")
+
+    def fastapi_default():
+        validated = SearchResponse.model_validate(results)
+        return json.dumps(
+            jsonable_encoder(validated), ensure_ascii=False, allow_nan=False,
+            indent=None, separators=(",", ":")
+        ).encode("utf-8")
+
+    def orjson_dumps():
+        return orjson.dumps(results)
+
+    rows = []
+    bodies = {}
+    for label, serialize in [('fastapi (default)', fastapi_default), ('orjson', orjson_dumps)]:
+        bodies[label] = serialize()
+        timing = summarize(time_calls(serialize, repeat))
+        rows.append([label, f"{timing['p50']:.2f}", f"{timing['p95']:.2f}", len(bodies[label])])
+    print_table(['serializer', 'p50 ms', 'p95 ms', 'bytes'], rows)
+
+    if json.loads(bodies['fastapi (default)']) != json.loads(bodies['orjson']):
+        print("\n✗ The two serializers produced different JSON")
+
+    body = bodies['orjson']
+    encoders = [('gzip (level 6)', gzip_bytes)]
+    if brotli:
+        encoders.append(('br (quality 5)', lambda data: brotli.compress(data, quality=5)))
+    else:
+        print("\nbrotli not installed: pip install Brotli to include it")
+
+    rows = [['identity', '-', '-', len(body), '100%']]
+    for label, compress in encoders:
+        compressed = compress(body)
+        timing = summarize(time_calls(lambda: compress(body), repeat))
+        rows.append([
+            label, f"{timing['p50']:.2f}", f"{timing['p95']:.2f}",
+            len(compressed), f"{len(compressed) / len(body):.0%}"
+        ])
+    print()
+    print_table(['encoding', 'p50 ms', 'p95 ms', 'bytes on wire', 'of identity'], rows)
+    print("\nAll times in milliseconds (serialization/compression only, no query).")
+
+    db.close_all_connections()
+
+
+if __name__ == '__main__':
+    main()
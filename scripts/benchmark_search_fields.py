@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark /search field selection (fields=) against the full result row
+
+Times one /search page three ways:
+  all:   every field (the default, no fields=)
+  ui:    the fields the search results view renders (UI_FIELDS)
+  ids:   occurrence ids only (no works/lines joins)
+and reports the page query p50/p95, EXPLAIN (ANALYZE, BUFFERS) for each, and the
+response body size. unique_words and total_count are skipped so only the page
+query is measured.
+
+Usage:
+    python benchmark_search_fields.py [database_url] [--word அறம்] [--match exact] [--limit 500] [--repeat N]
+"""
+
+import sys
+
+from benchmark_utils import (
+    add_backend_to_path, get_connection_string, print_table, summarize, time_calls
+)
+
+# Fields read by the search results view (webapp/frontend/src/MainApp.vue)
+UI_FIELDS = [
+    "word_id", "word_text", "line_id", "line_number", "line_text", "verse_id",
+    "verse_number", "verse_type", "verse_type_tamil", "work_name", "work_name_tamil",
+    "hierarchy_path", "hierarchy_path_tamil", "work_verse_count",
+]
+ID_FIELDS = ["word_id", "line_id", "verse_id", "work_id"]
+
+
+def get_option(name, default):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def main():
+    connection_string = get_connection_string()
+    word = get_option('--word', 'அறம்')
+    match_type = get_option('--match', 'exact')
+    limit = int(get_option('--limit', '500'))
+    repeat = int(get_option('--repeat', '20'))
+
+    add_backend_to_path()
+    import orjson
+    from database import Database, SEARCH_RESULT_COLUMNS
+    db = Database(connection_string)
+
+    field_sets = [('all', None), ('ui', UI_FIELDS), ('ids', ID_FIELDS)]
+
+    print("=" * 70)
+    print(f"/search fields= benchmark: '{word}' ({match_type}, limit={limit}, sort_by=canonical)")
+    print("=" * 70)
+    print(f"Repeat: {repeat} runs per field set (after 2 warmup runs)\n")
+
+    with db.get_connection() as conn:
+        with conn.cursor() as cur:
+            for label, fields in field_sets:
+                page = db._build_search_page_query(
+                    word, match_type, 'beginning', None, None, limit, 0, 'canonical', None, None, fields
+                )
+                print(f"--- EXPLAIN ANALYZE {label} ---")
+                cur.execute(f"EXPLAIN (ANALYZE, BUFFERS) {page['query']}", page['params'])
+                for (line,) in cur.fetchall():
+                    print(line)
+                print()
+
+    rows = []
+    for label, fields in field_sets:
+        def run(fields=fields):
+            return db.search_words(word, match_type=match_type, limit=limit, sort_by='canonical',
+                                   include_unique_words=False, fields=fields)
+
+        response = run()
+        response.pop('timings', None)
+        page_ms = []
+        for _ in range(repeat):
+            page_ms.append(run()['timings']['page'])
+        total = summarize(time_calls(run, repeat))
+        page = summarize(page_ms)
+        rows.append([
+            label, len(fields or SEARCH_RESULT_COLUMNS),
+            f"{page['p50']:.2f}", f"{page['p95']:.2f}", f"{total['p50']:.2f}",
+            len(orjson.dumps(response)),
+        ])
+
+    print_table(['fields', 'count', 'page p50', 'page p95', 'call p50', 'body bytes'], rows)
+    print("\nAll times in milliseconds (page = page query only, call = whole search_words).")
+
+    db.close_all_connections()
+
+
+if __name__ == '__main__':
+    main()
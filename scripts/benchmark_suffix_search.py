@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark suffix ("end") word searches before and after the reversed-text index
+
+Compares, for 1-, 2- and 3-grapheme Tamil suffixes, on word_occurrences (the
+table every search reads):
+  before: word_text LIKE '%term'            (sequential scan)
+  after:  reverse(word_text) LIKE 'mret%'   (idx_word_occurrences_text_reverse)
+and times the full Database.search_words() call on the new path.
+
+Usage:
+    python benchmark_suffix_search.py [database_url] [--repeat N]
+
+Requires migrations/007_add_word_occurrences.sql to be applied.
+"""
+
+import sys
+import psycopg2
+
+from benchmark_utils import (
+    add_backend_to_path, get_connection_string, print_table, summarize, time_calls
+)
+
+# Common Tamil word endings grouped by grapheme count
+SUFFIXES = {
+    1: ['ம்', 'ன்', 'ய்'],
+    2: ['கள்', 'த்து', 'ற்கு'],
+    3: ['த்தல்', 'கின்ற', 'ந்தனர்'],
+}
+
+
+def get_repeat():
+    if '--repeat' in sys.argv:
+        return int(sys.argv[sys.argv.index('--repeat') + 1])
+    return 20
+
+
+def escape_like(pattern):
+    return pattern.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def main():
+    connection_string = get_connection_string()
+    repeat = get_repeat()
+
+    conn = psycopg2.connect(connection_string)
+    conn.autocommit = True
+    cur = conn.cursor()
+
+    add_backend_to_path()
+    from database import Database
+    db = Database(connection_string)
+
+    print("=" * 70)
+    print("Suffix search benchmark (word_position=end)")
+    print("=" * 70)
+    print(f"Repeat: {repeat} runs per query (after 2 warmup runs)\n")
+
+    rows = []
+    for graphemes, suffixes in SUFFIXES.items():
+        for suffix in suffixes:
+            legacy_pattern = f"%{escape_like(suffix)}"
+            reversed_pattern = f"{escape_like(suffix[::-1])}%"
+
+            def run_legacy():
+                cur.execute("SELECT COUNT(*) FROM word_occurrences "
+                            "WHERE word_text LIKE %s ESCAPE '\\'",
+                            [legacy_pattern])
+                return cur.fetchone()[0]
+
+            def run_reversed():
+                cur.execute("SELECT COUNT(*) FROM word_occurrences "
+                            "WHERE reverse(word_text) LIKE %s ESCAPE '\\'",
+                            [reversed_pattern])
+                return cur.fetchone()[0]
+
+            def run_search():
+                db.search_words(suffix, match_type='partial', word_position='end', limit=100)
+
+            matches = run_reversed()
+            if matches != run_legacy():
+                print(f"✗ Mismatch for {suffix}: reversed and legacy predicates disagree")
+
+            before = summarize(time_calls(run_legacy, repeat))
+            after = summarize(time_calls(run_reversed, repeat))
+            search = summarize(time_calls(run_search, repeat))
+
+            rows.append([
+                graphemes, suffix, matches,
+                f"{before['p50']:.1f}", f"{before['p95']:.1f}",
+                f"{after['p50']:.1f}", f"{after['p95']:.1f}",
+                f"{search['p50']:.1f}", f"{search['p95']:.1f}",
+            ])
+
+    print_table(
+        ['graphemes', 'suffix', 'matches',
+         'before p50', 'before p95', 'after p50', 'after p95',
+         'search_words p50', 'search_words p95'],
+        rows
+    )
+    print("\nAll times in milliseconds.")
+
+    cur.close()
+    conn.close()
+    db.close_all_connections()
+
+
+if __name__ == '__main__':
+    main()
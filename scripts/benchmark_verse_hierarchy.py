@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark /verse/{id} before and after the section_paths closure table
+
+Runs the /verse/{id} query (database.VERSE_QUERY) two ways for a sample of verses:
+  before: verse_hierarchy as the former WITH RECURSIVE walk over all sections
+  after:  verse_hierarchy over section_paths (current view)
+prints EXPLAIN ANALYZE for one verse, checks both return the same hierarchy
+paths, and reports p50/p95 per verse.
+
+Usage:
+    python benchmark_verse_hierarchy.py [database_url] [--verses N] [--repeat N]
+
+Requires migrations/010_add_section_paths.sql to be applied.
+"""
+
+import sys
+import psycopg2
+
+from benchmark_utils import (
+    add_backend_to_path, get_connection_string, print_table, summarize, time_calls
+)
+
+# verse_hierarchy as defined before migrations/010
+LEGACY_VERSE_HIERARCHY = """(
+    WITH RECURSIVE section_path AS (
+        SELECT
+            section_id,
+            parent_section_id,
+            1 as depth,
+            level_type || ':' || section_name as path_names,
+            COALESCE(level_type_tamil, level_type) || ':' || COALESCE(section_name_tamil, section_name) as path_names_tamil
+        FROM sections
+        WHERE parent_section_id IS NULL
+
+        UNION ALL
+
+        SELECT
+            s.section_id,
+            s.parent_section_id,
+            sp.depth + 1,
+            sp.path_names || ' > ' || s.level_type || ':' || s.section_name,
+            sp.path_names_tamil || ' > ' || COALESCE(s.level_type_tamil, s.level_type) || ':' || COALESCE(s.section_name_tamil, s.section_name)
+        FROM sections s
+        INNER JOIN section_path sp ON s.parent_section_id = sp.section_id
+    )
+    SELECT
+        v.verse_id,
+        v.verse_type_tamil,
+        w.work_name,
+        w.work_name_tamil,
+        sp.path_names as hierarchy_path,
+        sp.path_names_tamil as hierarchy_path_tamil,
+        sp.depth as hierarchy_depth
+    FROM verses v
+    INNER JOIN works w ON v.work_id = w.work_id
+    INNER JOIN section_path sp ON v.section_id = sp.section_id
+)"""
+
+
+def get_option(name, default):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def main():
+    connection_string = get_connection_string()
+    verse_count = int(get_option('--verses', '5'))
+    repeat = int(get_option('--repeat', '20'))
+
+    add_backend_to_path()
+    from database import VERSE_QUERY
+
+    legacy_query = VERSE_QUERY.replace("JOIN verse_hierarchy vh", f"JOIN {LEGACY_VERSE_HIERARCHY} vh")
+    queries = [('before (recursive)', legacy_query), ('after (section_paths)', VERSE_QUERY)]
+
+    conn = psycopg2.connect(connection_string)
+    conn.autocommit = True
+    cur = conn.cursor()
+
+    # Verses spread across the corpus (first verse of evenly spaced works)
+    cur.execute("""
+        SELECT MIN(verse_id) FROM verses
+        GROUP BY work_id
+        ORDER BY work_id
+    """)
+    first_verses = [row[0] for row in cur.fetchall()]
+    step = max(1, len(first_verses) // verse_count)
+    verse_ids = first_verses[::step][:verse_count]
+
+    print("=" * 70)
+    print("/verse/{id} benchmark: recursive verse_hierarchy vs section_paths")
+    print("=" * 70)
+    print(f"Repeat: {repeat} runs per query (after 2 warmup runs)\n")
+
+    for label, query in queries:
+        print(f"--- EXPLAIN ANALYZE {label}, verse {verse_ids[0]} ---")
+        cur.execute(f"EXPLAIN (ANALYZE, BUFFERS) {query}", [verse_ids[0]])
+        for (line,) in cur.fetchall():
+            print(line)
+        print()
+
+    rows = []
+    for verse_id in verse_ids:
+        results = []
+        timings = []
+        for _, query in queries:
+            def run(query=query):
+                cur.execute(query, [verse_id])
+                return cur.fetchall()
+
+            results.append(run())
+            timings.append(summarize(time_calls(run, repeat)))
+
+        before, after = results
+        paths_match = ([(r[7], r[8]) for r in before] == [(r[7], r[8]) for r in after])
+        if not paths_match:
+            print(f"✗ Verse {verse_id}: hierarchy paths differ")
+
+        rows.append([
+            verse_id,
+            f"{timings[0]['p50']:.2f}", f"{timings[0]['p95']:.2f}",
+            f"{timings[1]['p50']:.2f}", f"{timings[1]['p95']:.2f}",
+            f"{timings[0]['p50'] / timings[1]['p50']:.1f}x" if timings[1]['p50'] else '-',
+            '✓' if paths_match else '✗',
+        ])
+
+    print_table(
+        ['verse_id', 'before p50', 'before p95', 'after p50', 'after p95', 'speedup', 'same paths'],
+        rows
+    )
+    print("\nAll times in milliseconds (verse query only, without lines).")
+
+    cur.close()
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
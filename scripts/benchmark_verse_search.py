@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark /search/verses (posting-list merge) against the same query in SQL
+
+For "verses containing every --all word, at least one --any word and no --none
+word", times:
+  postings: Database.search_verses (verse_postings lists merged in Python)
+  sql:      the same set computed over word_occurrences with GROUP BY verse_id
+and checks both find the same number of verses.
+
+Usage:
+    python benchmark_verse_search.py [database_url] [--all அறம்,பொருள்] [--any ...] [--none இன்பம்] [--repeat N]
+"""
+
+import sys
+
+from benchmark_utils import (
+    add_backend_to_path, get_connection_string, print_table, summarize, time_calls
+)
+
+
+def get_option(name, default):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def split_option(name, default):
+    return [word for word in get_option(name, default).split(',') if word]
+
+
+def build_sql_query(all_words, any_words, none_words):
+    """Matching verse count from word_occurrences (one row per verse and word)"""
+    conditions = [f"COUNT(DISTINCT o.word_text) FILTER (WHERE o.word_text = ANY(%s)) = {len(all_words)}"]
+    params = [all_words]
+    if any_words:
+        conditions.append("bool_or(o.word_text = ANY(%s))")
+        params.append(any_words)
+    if none_words:
+        conditions.append("NOT bool_or(o.word_text = ANY(%s))")
+        params.append(none_words)
+    query = f"""
+        SELECT COUNT(*) FROM (
+            SELECT o.verse_id
+            FROM word_occurrences o
+            WHERE o.verse_id IN (
+                SELECT verse_id FROM word_occurrences WHERE word_text = ANY(%s)
+            )
+            GROUP BY o.verse_id
+            HAVING {' AND '.join(conditions)}
+        ) matches
+    """
+    return query, [all_words or any_words] + params
+
+
+def main():
+    connection_string = get_connection_string()
+    all_words = split_option('--all', 'அறம்,பொருள்')
+    any_words = split_option('--any', '')
+    none_words = split_option('--none', 'இன்பம்')
+    repeat = int(get_option('--repeat', '20'))
+
+    add_backend_to_path()
+    from database import Database
+    db = Database(connection_string)
+
+    print("=" * 70)
+    print(f"/search/verses benchmark: all={all_words} any={any_words} none={none_words}")
+    print("=" * 70)
+    print(f"Repeat: {repeat} runs per method (after 2 warmup runs)\n")
+
+    def run_postings():
+        return db.search_verses(all_words, any_words, none_words, limit=50)['total_count']
+
+    sql_query, sql_params = build_sql_query(all_words, any_words, none_words)
+
+    def run_sql():
+        with db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql_query, sql_params)
+                return cur.fetchone()[0]
+
+    rows = []
+    counts = {}
+    for label, run in [('postings', run_postings), ('sql', run_sql)]:
+        counts[label] = run()
+        timing = summarize(time_calls(run, repeat))
+        rows.append([label, counts[label], f"{timing['p50']:.2f}", f"{timing['p95']:.2f}"])
+    print_table(['method', 'verses', 'p50 ms', 'p95 ms'], rows)
+    print("\nAll times in milliseconds (postings includes fetching the first page of 50 verses).")
+
+    if counts['postings'] != counts['sql']:
+        print("\n✗ The two methods found different verse counts")
+
+    db.close_all_connections()
+
+
+if __name__ == '__main__':
+    main()
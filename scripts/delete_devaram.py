@@ -16,6 +16,7 @@ Usage:
 import os
 import sys
 import psycopg2
+from search_index import refresh_corpus_stats, remove_work_from_search_index
 
 def delete_devaram(connection_string):
     """Delete all Devaram data in correct order"""
@@ -82,6 +83,8 @@ def delete_devaram(connection_string):
         print("  Deleting main Devaram collection...")
         cursor.execute("DELETE FROM collections WHERE collection_id = 3211")
 
+        conn.commit()
+        refresh_corpus_stats(cursor)  # /stats without the deleted works
         conn.commit()
         print("\n✓ Successfully deleted all Devaram data")
         return True
@@ -101,6 +104,9 @@ def delete_devaram(connection_string):
 
 def delete_work_by_id(cursor, work_id):
     """Delete a work and all its data (within a transaction)"""
+    # Remove derived search rows (word_occurrences) first
+    remove_work_from_search_index(cursor, work_id)
+
     # Delete words
     cursor.execute("""
         DELETE FROM words
@@ -20,6 +20,7 @@ Usage:
 import os
 import sys
 import psycopg2
+from search_index import refresh_corpus_stats, remove_work_from_search_index
 
 def delete_naalayira_divya_prabandham(connection_string):
     """Delete all Naalayira Divya Prabandham works and collections"""
@@ -87,6 +88,8 @@ def delete_naalayira_divya_prabandham(connection_string):
         print("  Deleting main collection 322 (நாலாயிரத் திவ்விய பிரபந்தம்)...")
         cursor.execute("DELETE FROM collections WHERE collection_id = 322")
 
+        conn.commit()
+        refresh_corpus_stats(cursor)  # /stats without the deleted works
         conn.commit()
         print("\n✓ Successfully deleted all Naalayira Divya Prabandham data")
         return True
@@ -106,6 +109,9 @@ def delete_naalayira_divya_prabandham(connection_string):
 
 def delete_work_by_id(cursor, work_id):
     """Delete a work and all its data (within a transaction)"""
+    # Remove derived search rows (word_occurrences) first
+    remove_work_from_search_index(cursor, work_id)
+
     # Delete words
     cursor.execute("""
         DELETE FROM words
@@ -14,6 +14,7 @@ Usage:
 import os
 import sys
 import psycopg2
+from search_index import refresh_corpus_stats, remove_work_from_search_index
 
 def delete_saiva_prabandha_malai(connection_string):
     """Delete all Saiva Prabandha Malai works and collection"""
@@ -64,6 +65,8 @@ def delete_saiva_prabandha_malai(connection_string):
         print("  Deleting collection 32118 (பதினொன்றாம் திருமுறை - Eleventh Thirumurai)...")
         cursor.execute("DELETE FROM collections WHERE collection_id = 32118")
 
+        conn.commit()
+        refresh_corpus_stats(cursor)  # /stats without the deleted works
         conn.commit()
         print("\n✓ Successfully deleted all Saiva Prabandha Malai data")
         return True
@@ -83,6 +86,9 @@ def delete_saiva_prabandha_malai(connection_string):
 
 def delete_work_by_id(cursor, work_id):
     """Delete a work and all its data (within a transaction)"""
+    # Remove derived search rows (word_occurrences) first
+    remove_work_from_search_index(cursor, work_id)
+
     # Delete words
     cursor.execute("""
         DELETE FROM words
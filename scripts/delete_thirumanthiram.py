@@ -14,6 +14,7 @@ Usage:
 import os
 import sys
 import psycopg2
+from search_index import refresh_corpus_stats, remove_work_from_search_index
 
 def delete_thirumanthiram(connection_string):
     """Delete Thirumanthiram work and collection"""
@@ -60,6 +61,8 @@ def delete_thirumanthiram(connection_string):
         print("  Deleting collection 32110 (பத்தாம் திருமுறை)...")
         cursor.execute("DELETE FROM collections WHERE collection_id = 32110")
 
+        conn.commit()
+        refresh_corpus_stats(cursor)  # /stats without the deleted works
         conn.commit()
         print("\n✓ Successfully deleted Thirumanthiram work and collection")
         return True
@@ -79,6 +82,9 @@ def delete_thirumanthiram(connection_string):
 
 def delete_work_by_id(cursor, work_id):
     """Delete a work and all its data (within a transaction)"""
+    # Remove derived search rows (word_occurrences) first
+    remove_work_from_search_index(cursor, work_id)
+
     # Delete words
     cursor.execute("""
         DELETE FROM words
@@ -13,6 +13,7 @@ Usage:
 import os
 import sys
 import psycopg2
+from search_index import refresh_corpus_stats, remove_work_from_search_index
 
 def delete_thiruvarutpa_balakrishnapillai(connection_string):
     """Delete Thiruvarutpa Balakrishnapillai Edition"""
@@ -59,6 +60,8 @@ def delete_thiruvarutpa_balakrishnapillai(connection_string):
         # Check and delete collection 323 if empty
         delete_collection_if_empty(cursor, 323)
 
+        conn.commit()
+        refresh_corpus_stats(cursor)  # /stats without the deleted works
         conn.commit()
         print("\n✓ Successfully deleted Thiruvarutpa works")
         return True
@@ -97,6 +100,9 @@ def delete_collection_if_empty(cursor, collection_id=323):
 
 def delete_work_by_id(cursor, work_id):
     """Delete a work and all its data (within a transaction)"""
+    # Remove derived search rows (word_occurrences) first
+    remove_work_from_search_index(cursor, work_id)
+
     # Delete words
     cursor.execute("""
         DELETE FROM words
@@ -15,6 +15,7 @@ Usage:
 import os
 import sys
 import psycopg2
+from search_index import refresh_corpus_stats, remove_work_from_search_index
 
 def delete_thiruvasagam(connection_string):
     """Delete Thiruvasagam work and collection 3218 if it becomes empty"""
@@ -78,6 +79,8 @@ def delete_thiruvasagam(connection_string):
             cursor.execute("DELETE FROM collections WHERE collection_id = 3218")
             print(f"  ✓ Deleted empty collection 3218")
 
+        conn.commit()
+        refresh_corpus_stats(cursor)  # /stats without the deleted works
         conn.commit()
         print("\n✓ Successfully deleted Thiruvasagam work")
         return True
@@ -97,6 +100,9 @@ def delete_thiruvasagam(connection_string):
 
 def delete_work_by_id(cursor, work_id):
     """Delete a work and all its data (within a transaction)"""
+    # Remove derived search rows (word_occurrences) first
+    remove_work_from_search_index(cursor, work_id)
+
     # Delete words
     cursor.execute("""
         DELETE FROM words
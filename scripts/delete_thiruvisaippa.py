@@ -15,6 +15,7 @@ Usage:
 import os
 import sys
 import psycopg2
+from search_index import refresh_corpus_stats, remove_work_from_search_index
 
 def delete_thiruvisaippa(connection_string):
     """Delete all Thiruvisaippa works and collections"""
@@ -74,6 +75,8 @@ def delete_thiruvisaippa(connection_string):
         print("  Deleting main collection 3219 (ஒன்பதாம் திருமுறை)...")
         cursor.execute("DELETE FROM collections WHERE collection_id = 3219")
 
+        conn.commit()
+        refresh_corpus_stats(cursor)  # /stats without the deleted works
         conn.commit()
         print("\n✓ Successfully deleted all Thiruvisaippa data")
         return True
@@ -93,6 +96,9 @@ def delete_thiruvisaippa(connection_string):
 
 def delete_work_by_id(cursor, work_id):
     """Delete a work and all its data (within a transaction)"""
+    # Remove derived search rows (word_occurrences) first
+    remove_work_from_search_index(cursor, work_id)
+
     # Delete words
     cursor.execute("""
         DELETE FROM words
@@ -18,6 +18,7 @@ Examples:
 import os
 import sys
 import psycopg2
+from search_index import refresh_corpus_stats, remove_work_from_search_index
 
 def get_connection_string():
     """Get database connection string"""
@@ -111,6 +112,9 @@ def delete_work(work_name: str, connection_string: str):
         # Delete in order of dependencies (CASCADE will handle it, but being explicit)
         print("\nDeleting data...")
 
+        # Remove derived search rows (word_occurrences) first
+        remove_work_from_search_index(cursor, work_id)
+
         # Delete words (via lines -> verses -> work)
         print("  Deleting words...")
         cursor.execute("""
@@ -179,6 +183,8 @@ def delete_work(work_name: str, connection_string: str):
         cursor.execute("DELETE FROM works WHERE work_id = %s", [work_id])
         print(f"    ✓ Deleted work")
 
+        refresh_corpus_stats(cursor)  # /stats without the deleted work
+
         cursor.close()
         conn.close()
 
@@ -280,6 +286,8 @@ def delete_collection_and_works(collection_id, connection_string):
         cursor.execute("DELETE FROM collections WHERE collection_id = %s", [collection_id])
         print(f"  ✓ Deleted collection")
 
+        conn.commit()
+        refresh_corpus_stats(cursor)  # /stats without the deleted works
         conn.commit()
         cursor.close()
         conn.close()
@@ -297,6 +305,9 @@ def delete_collection_and_works(collection_id, connection_string):
 
 def delete_work_by_id(cursor, work_id):
     """Delete a work by ID (used within a transaction)"""
+    # Remove derived search rows (word_occurrences) first
+    remove_work_from_search_index(cursor, work_id)
+
     # Delete words
     cursor.execute("""
         DELETE FROM words
@@ -402,6 +413,8 @@ def main():
                 sys.exit(0)
 
             if delete_work_by_id(cursor, work_id):
+                conn.commit()
+                refresh_corpus_stats(cursor)  # /stats without the deleted work
                 conn.commit()
                 print(f"\n✓ Work {work_id} deleted successfully")
             else:
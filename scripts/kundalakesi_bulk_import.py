@@ -21,6 +21,7 @@ import csv
 import io
 from pathlib import Path
 from word_cleaning import split_and_clean_words
+from search_index import refresh_work_search_index
 
 
 def clean_line(line):
@@ -302,6 +303,9 @@ class KundalakesiBulkImporter:
         self._bulk_copy('words', self.words,
                        ['word_id', 'line_id', 'word_position', 'word_text', 'sandhi_split'])
 
+        # Refresh derived search tables (word_occurrences) for this work
+        refresh_work_search_index(self.cursor, self.work_id)
+
         self.conn.commit()
         print("✓ Phase 2 complete: All data inserted")
 
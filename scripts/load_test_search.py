@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Load test: many concurrent /search clients against a running API
+
+Each client thread issues --requests searches (cycling through common words)
+and records latency and status. Reports failures, any pool errors
+(PoolError/PoolTimeout surfaced as 500s), latency percentiles and the
+server's /debug/metrics pool counters after the run.
+
+Usage:
+    python load_test_search.py [api_url] [--clients 100] [--requests 20]
+
+Example (API started with: uvicorn main:app --port 8000):
+    python load_test_search.py http://localhost:8000 --clients 100
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmark_utils import print_table, summarize
+
+WORDS = ['அறம்', 'பொருள்', 'இன்பம்', 'உலகு', 'மழை', 'அன்பு', 'கண்', 'நீர்']
+
+
+def get_option(name, default):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def main():
+    api_url = sys.argv[1] if len(sys.argv) > 1 and not sys.argv[1].startswith('--') \
+        else 'http://localhost:8000'
+    clients = int(get_option('--clients', '100'))
+    per_client = int(get_option('--requests', '20'))
+
+    print("=" * 70)
+    print(f"Load test: {clients} concurrent clients x {per_client} /search requests")
+    print(f"API: {api_url}")
+    print("=" * 70)
+
+    latencies = []
+    statuses = Counter()
+    pool_errors = []
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(clients)
+
+    def client(client_id):
+        session = requests.Session()
+        start_barrier.wait()  # Start every client at once
+        for i in range(per_client):
+            word = WORDS[(client_id + i) % len(WORDS)]
+            params = {'q': word, 'match_type': 'exact', 'limit': 100, 'sort_by': 'canonical'}
+            start = time.perf_counter()
+            try:
+                response = session.get(f"{api_url}/search", params=params, timeout=60)
+                status = response.status_code
+                detail = response.text if status >= 400 else ''
+            except requests.RequestException as e:
+                status, detail = 'error', str(e)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            with lock:
+                latencies.append(elapsed_ms)
+                statuses[status] += 1
+                if 'pool' in detail.lower():
+                    pool_errors.append(detail[:200])
+
+    run_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        list(executor.map(client, range(clients)))
+    run_seconds = time.perf_counter() - run_start
+
+    total = sum(statuses.values())
+    stats = summarize(latencies)
+    print(f"\n{total} requests in {run_seconds:.1f}s ({total / run_seconds:.0f} req/s)")
+    print("Status codes: " + ", ".join(f"{code}={count}" for code, count in sorted(statuses.items(), key=str)))
+    print_table(
+        ['p50 ms', 'p95 ms', 'max ms'],
+        [[f"{stats['p50']:.1f}", f"{stats['p95']:.1f}", f"{stats['max']:.1f}"]]
+    )
+
+    try:
+        metrics = requests.get(f"{api_url}/debug/metrics", timeout=10).json()
+        pool_stats = metrics['pool']
+        print("\nServer pool metrics:")
+        for key in ('maxconn', 'open', 'in_use', 'idle', 'checkouts', 'waits',
+                    'wait_ms_avg', 'wait_ms_max', 'timeouts'):
+            print(f"  {key}: {pool_stats.get(key)}")
+    except (requests.RequestException, ValueError, KeyError) as e:
+        print(f"\n(Could not read /debug/metrics: {e})")
+
+    if pool_errors:
+        print(f"\n✗ {len(pool_errors)} pool errors, e.g.: {pool_errors[0]}")
+        sys.exit(1)
+    print("\n✓ No pool errors")
+
+
+if __name__ == '__main__':
+    main()
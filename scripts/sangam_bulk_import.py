@@ -14,6 +14,7 @@ IMPROVEMENTS (2025-12-05):
 
 import re
 import psycopg2
+from search_index import refresh_work_search_index, refresh_corpus_stats
 from pathlib import Path
 from typing import Dict, List
 import csv
@@ -524,6 +525,10 @@ class SangamBulkImporter:
                 # Phase 2: Bulk insert for this work
                 self._bulk_insert_work(work_info['work_name_tamil'])
 
+                # Refresh derived search tables (word_occurrences) for this work;
+                # /stats is refreshed once after the last work
+                refresh_work_search_index(self.cursor, work_info['work_id'], update_corpus_stats=False)
+
                 # Commit this work
                 self.conn.commit()
                 print(f"✓ {work_info['work_name_tamil']} imported successfully")
@@ -539,6 +544,10 @@ class SangamBulkImporter:
                 # Clear data containers for next work
                 self._reset_data_containers()
 
+        if success_count:
+            refresh_corpus_stats(self.cursor)
+            self.conn.commit()
+
         # Summary
         print(f"\n{'='*70}")
         print(f"Import Summary:")
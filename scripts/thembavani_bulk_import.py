@@ -30,6 +30,7 @@ import re
 import json
 import io
 import psycopg2
+from search_index import refresh_work_search_index, refresh_corpus_stats
 from typing import List, Dict
 
 class ThembavaniBulkImporter:
@@ -513,6 +514,11 @@ class ThembavaniBulkImporter:
             # Link work to collection
             self.link_work_to_collection()
 
+            # Refresh derived search tables (word_occurrences) for the imported works
+            for work in self.works:
+                refresh_work_search_index(self.cursor, work['work_id'], update_corpus_stats=False)
+            refresh_corpus_stats(self.cursor)  # Once for all works
+
             self.conn.commit()
             print("\n[SUCCESS] Thembavani imported successfully!")
         except Exception as e:
@@ -14,6 +14,7 @@ from typing import Dict, List
 import csv
 import io
 from word_cleaning import split_and_clean_words
+from search_index import refresh_work_search_index
 
 class ThirukkuralBulkImporter:
     def __init__(self, db_connection_string: str):
@@ -299,6 +300,9 @@ class ThirukkuralBulkImporter:
         self._bulk_copy('words', self.words,
                        ['word_id', 'line_id', 'word_position', 'word_text', 'sandhi_split'])
 
+        # Refresh derived search tables (word_occurrences) for this work
+        refresh_work_search_index(self.cursor, self.work_id)
+
         self.conn.commit()
         print("✓ Phase 2 complete: All data inserted")
 
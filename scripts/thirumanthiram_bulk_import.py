@@ -30,6 +30,7 @@ import io
 import sys
 import os
 from word_cleaning import split_and_clean_words
+from search_index import refresh_work_search_index, refresh_corpus_stats
 
 class ThirumanthiramBulkImporter:
     def __init__(self, db_connection_string: str):
@@ -477,6 +478,11 @@ class ThirumanthiramBulkImporter:
             self.bulk_insert_lines()
             self.bulk_insert_words()
 
+            # Refresh derived search tables (word_occurrences) for the imported works
+            for work in self.works:
+                refresh_work_search_index(self.cursor, work['work_id'], update_corpus_stats=False)
+            refresh_corpus_stats(self.cursor)  # Once for all works
+
             self.conn.commit()
             print("[OK] Phase 2 complete: All data committed")
 
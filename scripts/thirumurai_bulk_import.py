@@ -29,6 +29,7 @@ import io
 import sys
 import os
 from word_cleaning import split_and_clean_words
+from search_index import refresh_work_search_index, refresh_corpus_stats
 
 class ThirumuraiBulkImporter:
     def __init__(self, db_connection_string: str):
@@ -949,6 +950,11 @@ class ThirumuraiBulkImporter:
             self._bulk_copy('words', self.words,
                            ['word_id', 'line_id', 'word_position', 'word_text', 'sandhi_split'])
 
+        # Refresh derived search tables (word_occurrences) for the imported works
+        for work in self.works:
+            refresh_work_search_index(self.cursor, work['work_id'], update_corpus_stats=False)
+        refresh_corpus_stats(self.cursor)  # Once for all works
+
         self.conn.commit()
         print("[OK] Phase 2 complete: All data inserted")
 
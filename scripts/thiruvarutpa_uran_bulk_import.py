@@ -22,6 +22,7 @@ import re
 import io
 import json
 import psycopg2
+from search_index import refresh_work_search_index, refresh_corpus_stats
 from typing import List, Dict, Optional
 
 class ThiruvarutpaImporter:
@@ -487,6 +488,11 @@ class ThiruvarutpaImporter:
             print(f"  [OK] Inserted {len(self.words)} words")
 
             # Commit transaction
+            # Refresh derived search tables (word_occurrences) for the imported works
+            for work in self.works:
+                refresh_work_search_index(self.cursor, work['work_id'], update_corpus_stats=False)
+            refresh_corpus_stats(self.cursor)  # Once for all works
+
             self.conn.commit()
             print("\n  [OK] All data committed successfully")
 
@@ -26,6 +26,7 @@ import json
 import io
 import csv
 import psycopg2
+from search_index import refresh_work_search_index, refresh_corpus_stats
 from typing import List, Dict
 
 class ThiruvasagamBulkImporter:
@@ -546,6 +547,11 @@ class ThiruvasagamBulkImporter:
             self.bulk_insert_verses()
             self.bulk_insert_lines()
             self.bulk_insert_words()
+            # Refresh derived search tables (word_occurrences) for the imported works
+            for work in self.works:
+                refresh_work_search_index(self.cursor, work['work_id'], update_corpus_stats=False)
+            refresh_corpus_stats(self.cursor)  # Once for all works
+
             self.conn.commit()
             print("\n[SUCCESS] Thiruvasagam imported successfully!")
         except Exception as e:
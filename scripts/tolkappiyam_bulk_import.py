@@ -20,6 +20,7 @@ IMPROVEMENTS:
 
 import re
 import psycopg2
+from search_index import refresh_work_search_index
 from pathlib import Path
 from typing import Dict, List
 import csv
@@ -485,6 +486,9 @@ class TolkappiyamBulkImporter:
             self._bulk_copy('words', self.words,
                            ['word_id', 'line_id', 'word_position', 'word_text', 'sandhi_split'])
 
+        # Refresh derived search tables (word_occurrences) for this work
+        refresh_work_search_index(self.cursor, self.work_id)
+
     def _bulk_copy(self, table_name, data, columns):
         """Use PostgreSQL COPY for bulk insert"""
         if not data:
@@ -6,6 +6,16 @@ Shared word cleaning functions for all parsers
 """
 
 import re
+import sys
+import unicodedata
+from pathlib import Path
+
+# split_tamil_graphemes / grapheme_key are shared with the API (webapp/backend/tamil_text.py),
+# so keys stored in word_graphemes and keys of query terms come from the same code
+_BACKEND_DIR = str(Path(__file__).resolve().parent.parent / 'webapp' / 'backend')
+if _BACKEND_DIR not in sys.path:
+    sys.path.append(_BACKEND_DIR)
+from tamil_text import grapheme_key, split_tamil_graphemes  # noqa: E402
 
 def clean_tamil_word(word: str) -> str:
     """
@@ -103,6 +113,57 @@ def split_and_clean_words(line_text: str) -> list:
     return cleaned_words
 
 
+# Tamil alphabet order: uyir (vowels), aytham, then each consonant as mei (with
+# pulli) followed by its uyirmei series (inherent a, then the vowel signs)
+TAMIL_VOWELS = 'அஆஇஈஉஊஎஏஐஒஓஔ'
+TAMIL_VOWEL_SIGNS = '\u0BCD' + '\u0BBE\u0BBF\u0BC0\u0BC1\u0BC2\u0BC6\u0BC7\u0BC8\u0BCA\u0BCB\u0BCC'
+TAMIL_CONSONANTS = 'கஙசஞடணதநபமயரலவழளறன' + 'ஜஶஷஸஹ'  # Grantha letters last
+TAMIL_AYTHAM = 'ஃ'
+
+
+def _tamil_letter_unit(grapheme: str):
+    """3-byte sort unit of a Tamil letter (vowel, aytham, mei or uyirmei), or None"""
+    if len(grapheme) == 1 and grapheme in TAMIL_VOWELS:
+        return bytes((1, 0, TAMIL_VOWELS.index(grapheme) + 1))
+    if grapheme == TAMIL_AYTHAM:
+        return bytes((2, 0, 0))
+    consonant, sign = grapheme[0], grapheme[1:]
+    if consonant not in TAMIL_CONSONANTS:
+        return None
+    if not sign:
+        order = 1  # Inherent a: after the mei (order 0)
+    elif len(sign) == 1 and sign in TAMIL_VOWEL_SIGNS:
+        order = 0 if sign == '\u0BCD' else TAMIL_VOWEL_SIGNS.index(sign) + 1
+    else:
+        return None
+    return bytes((3, TAMIL_CONSONANTS.index(consonant), order))
+
+
+def tamil_sort_key(word: str) -> bytes:
+    """
+    Collation key following Tamil alphabet order (compare keys as bytes)
+
+    Each grapheme becomes a 3-byte unit, so a word's key sorts with byte order
+    (PostgreSQL bytea, Python bytes) independently of the database collation.
+    Characters outside the Tamil alphabet (hyphens, underscores) sort before all
+    Tamil letters, in code point order.
+
+    Examples:
+        sorted(['கா', 'க்க', 'அம்', 'கடல்'], key=tamil_sort_key)
+        → ['அம்', 'க்க', 'கடல்', 'கா']
+    """
+    units = []
+    for grapheme in split_tamil_graphemes(unicodedata.normalize('NFC', word)):
+        unit = _tamil_letter_unit(grapheme)
+        if unit is not None:
+            units.append(unit)
+            continue
+        for char in grapheme:
+            code = min(ord(char), 0xFFFF)
+            units.append(bytes((0, code >> 8, code & 0xFF)))
+    return b''.join(units)
+
+
 # Test function
 def test_word_cleaning():
     """Test cases for word cleaning"""
@@ -116,6 +177,14 @@ def test_word_cleaning():
         ('அறம் கடல் 5', ['அறம்', 'கடல்']),
         ('வான் 10 மலை 15', ['வான்', 'மலை']),
     ]
+    grapheme_cases = [
+        ('அறம்', '|அ|ற|ம்|'),
+        ('கோவில்', '|கோ|வி|ல்|'),
+        ('க', '|க|'),
+        ('க\u0BC6\u0BBEடி', '|கொ|டி|'),  # Decomposed vowel sign keys like its NFC form
+    ]
+    # Already in Tamil alphabet order
+    sort_cases = ['அம்', 'அறம்', 'ஆறு', 'ஃது', 'க்க', 'கடல்', 'கடல்-நிலா', 'கா', 'கொடி', 'ஙனம்']
 
     print("Testing word cleaning...")
     for test_input, expected in test_cases:
@@ -133,6 +202,15 @@ def test_word_cleaning():
                 status = '✓' if result == expected else '✗'
                 print(f"{status} clean_tamil_word('{test_input}') = '{result}' (expected '{expected}')")
 
+    for test_input, expected in grapheme_cases:
+        result = grapheme_key(test_input)
+        status = '✓' if result == expected else '✗'
+        print(f"{status} grapheme_key('{test_input}') = '{result}' (expected '{expected}')")
+
+    result = sorted(reversed(sort_cases), key=tamil_sort_key)
+    status = '✓' if result == sort_cases else '✗'
+    print(f"{status} sorted(key=tamil_sort_key) = {result}")
+
 
 if __name__ == '__main__':
     test_word_cleaning()
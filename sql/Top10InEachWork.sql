@@ -1,18 +1,13 @@
-WITH word_counts AS (
-    SELECT
-		wk.work_id,
-        wk.work_name_tamil,
-        word_text,
-        COUNT(*) AS freq,
-        ROW_NUMBER() OVER (
-            PARTITION BY wk.work_name_tamil
-            ORDER BY COUNT(*) DESC
-        ) AS rn
-    FROM word_details wd
-	join works wk on wk.work_name=wd.work_name
-    GROUP BY work_id,word_text, wk.work_name_tamil
-)
-SELECT work_id,work_name_tamil, word_text, freq
-FROM word_counts
-WHERE rn <= 10
-ORDER BY work_id, freq DESC;
+-- Ten most frequent words of every work, read in order from the per-work
+-- frequency table (word_work_freq, idx_word_work_freq_work_top) instead of
+-- grouping every word of word_details (see /works/{id}/top-words)
+SELECT wk.work_id, wk.work_name_tamil, t.word_text, t.occurrence_count AS freq
+FROM works wk
+CROSS JOIN LATERAL (
+    SELECT f.word_text, f.occurrence_count
+    FROM word_work_freq f
+    WHERE f.work_id = wk.work_id
+    ORDER BY f.occurrence_count DESC, f.word_text
+    LIMIT 10
+) t
+ORDER BY wk.work_id, freq DESC;
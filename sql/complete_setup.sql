@@ -117,6 +117,137 @@ CREATE TABLE sections (
 CREATE INDEX idx_sections_parent ON sections(parent_section_id);
 CREATE INDEX idx_sections_work ON sections(work_id);
 
+-- Section path closure: one row per (ancestor, descendant) pair including the
+-- section itself (distance 0), whose row also carries the precomputed path.
+-- Maintained by the triggers below and by scripts/search_index.py (migrations/010)
+CREATE TABLE section_paths (
+    ancestor_id INTEGER NOT NULL,
+    descendant_id INTEGER NOT NULL,
+    distance INTEGER NOT NULL,  -- 0 for the section itself, 1 for its parent, ...
+    depth INTEGER,  -- Self row only: 1 for top-level sections
+    hierarchy_path TEXT,  -- Self row only: 'level:name > level:name'
+    hierarchy_path_tamil TEXT,
+    PRIMARY KEY (ancestor_id, descendant_id),
+    FOREIGN KEY (ancestor_id) REFERENCES sections(section_id) ON DELETE CASCADE,
+    FOREIGN KEY (descendant_id) REFERENCES sections(section_id) ON DELETE CASCADE
+);
+
+-- Ancestors of a section, and its self row (descendant_id = x AND distance = 0)
+CREATE INDEX idx_section_paths_descendant ON section_paths(descendant_id, distance);
+
+CREATE OR REPLACE FUNCTION refresh_section_paths(p_work_id INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    inserted_count INTEGER;
+BEGIN
+    DELETE FROM section_paths sp
+    USING sections s
+    WHERE sp.descendant_id = s.section_id AND s.work_id = p_work_id;
+
+    WITH RECURSIVE section_path AS (
+        SELECT
+            section_id,
+            1 AS depth,
+            ARRAY[section_id] AS ancestors,
+            level_type || ':' || section_name AS path_names,
+            COALESCE(level_type_tamil, level_type) || ':' || COALESCE(section_name_tamil, section_name) AS path_names_tamil
+        FROM sections
+        WHERE work_id = p_work_id AND parent_section_id IS NULL
+
+        UNION ALL
+
+        SELECT
+            s.section_id,
+            sp.depth + 1,
+            sp.ancestors || s.section_id,
+            sp.path_names || ' > ' || s.level_type || ':' || s.section_name,
+            sp.path_names_tamil || ' > ' || COALESCE(s.level_type_tamil, s.level_type) || ':' || COALESCE(s.section_name_tamil, s.section_name)
+        FROM sections s
+        INNER JOIN section_path sp ON s.parent_section_id = sp.section_id
+    )
+    INSERT INTO section_paths (ancestor_id, descendant_id, distance, depth, hierarchy_path, hierarchy_path_tamil)
+    SELECT
+        a.ancestor_id,
+        sp.section_id,
+        sp.depth - a.position::INTEGER,
+        CASE WHEN a.position = sp.depth THEN sp.depth END,
+        CASE WHEN a.position = sp.depth THEN sp.path_names END,
+        CASE WHEN a.position = sp.depth THEN sp.path_names_tamil END
+    FROM section_path sp
+    CROSS JOIN LATERAL unnest(sp.ancestors) WITH ORDINALITY AS a(ancestor_id, position);
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN inserted_count;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION trg_sections_insert_paths()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Self row: parent's path extended by this section
+    INSERT INTO section_paths (ancestor_id, descendant_id, distance, depth, hierarchy_path, hierarchy_path_tamil)
+    SELECT
+        NEW.section_id,
+        NEW.section_id,
+        0,
+        COALESCE(p.depth, 0) + 1,
+        CASE WHEN NEW.parent_section_id IS NULL
+            THEN NEW.level_type || ':' || NEW.section_name
+            ELSE p.hierarchy_path || ' > ' || NEW.level_type || ':' || NEW.section_name
+        END,
+        CASE WHEN NEW.parent_section_id IS NULL
+            THEN COALESCE(NEW.level_type_tamil, NEW.level_type) || ':' || COALESCE(NEW.section_name_tamil, NEW.section_name)
+            ELSE p.hierarchy_path_tamil || ' > ' || COALESCE(NEW.level_type_tamil, NEW.level_type) || ':' || COALESCE(NEW.section_name_tamil, NEW.section_name)
+        END
+    FROM (SELECT 1) AS one
+    LEFT JOIN section_paths p
+        ON p.descendant_id = NEW.parent_section_id AND p.distance = 0;
+
+    -- Every ancestor of the parent (including the parent) is an ancestor of this section
+    INSERT INTO section_paths (ancestor_id, descendant_id, distance)
+    SELECT ancestor_id, NEW.section_id, distance + 1
+    FROM section_paths
+    WHERE descendant_id = NEW.parent_section_id;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION trg_sections_update_paths()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Moving or renaming a section changes the paths of its whole subtree;
+    -- rebuilding the affected works is simpler and still only touches those works
+    PERFORM refresh_section_paths(changed.work_id)
+    FROM (
+        SELECT n.work_id
+        FROM new_rows n
+        INNER JOIN old_rows o ON o.section_id = n.section_id
+        WHERE (n.work_id, n.parent_section_id, n.level_type, n.level_type_tamil, n.section_name, n.section_name_tamil)
+              IS DISTINCT FROM
+              (o.work_id, o.parent_section_id, o.level_type, o.level_type_tamil, o.section_name, o.section_name_tamil)
+        UNION
+        SELECT o.work_id
+        FROM new_rows n
+        INNER JOIN old_rows o ON o.section_id = n.section_id
+        WHERE n.work_id IS DISTINCT FROM o.work_id
+    ) changed;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER sections_insert_paths
+AFTER INSERT ON sections
+FOR EACH ROW EXECUTE FUNCTION trg_sections_insert_paths();
+
+-- Transition tables cannot be combined with an UPDATE OF column list, so the
+-- function compares old and new rows itself
+CREATE TRIGGER sections_update_paths
+AFTER UPDATE ON sections
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION trg_sections_update_paths();
+
 -- Verses/Poems/Sutras table (the atomic textual unit before lines)
 CREATE TABLE verses (
     verse_id SERIAL PRIMARY KEY,
@@ -174,6 +305,48 @@ CREATE INDEX idx_words_root ON words(word_root);
 CREATE INDEX idx_words_text_line ON words(word_text, line_id);
 CREATE INDEX idx_words_root_text ON words(word_root, word_text) WHERE word_root IS NOT NULL;
 
+-- Trigram operator classes for the substring search indexes on word_occurrences
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Per-work aggregate counts (verses, lines, words, distinct words), refreshed by
+-- scripts/search_index.py on every import (migrations/011)
+CREATE TABLE work_stats (
+    work_id INTEGER PRIMARY KEY,
+    verse_count INTEGER NOT NULL DEFAULT 0,
+    line_count INTEGER NOT NULL DEFAULT 0,
+    word_count INTEGER NOT NULL DEFAULT 0,
+    distinct_word_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (work_id) REFERENCES works(work_id) ON DELETE CASCADE
+);
+
+CREATE OR REPLACE FUNCTION refresh_work_stats(p_work_id INTEGER)
+RETURNS VOID AS $$
+    INSERT INTO work_stats AS ws (work_id, verse_count, line_count, word_count, distinct_word_count, updated_at)
+    SELECT
+        p_work_id,
+        (SELECT COUNT(*) FROM verses WHERE work_id = p_work_id),
+        (SELECT COUNT(*)
+         FROM lines l
+         INNER JOIN verses v ON l.verse_id = v.verse_id
+         WHERE v.work_id = p_work_id),
+        word_totals.word_count,
+        word_totals.distinct_word_count
+    FROM (
+        SELECT COUNT(*) AS word_count, COUNT(DISTINCT w.word_text) AS distinct_word_count
+        FROM words w
+        INNER JOIN lines l ON w.line_id = l.line_id
+        INNER JOIN verses v ON l.verse_id = v.verse_id
+        WHERE v.work_id = p_work_id
+    ) word_totals
+    ON CONFLICT (work_id) DO UPDATE SET
+        verse_count = EXCLUDED.verse_count,
+        line_count = EXCLUDED.line_count,
+        word_count = EXCLUDED.word_count,
+        distinct_word_count = EXCLUDED.distinct_word_count,
+        updated_at = CURRENT_TIMESTAMP;
+$$ LANGUAGE sql;
+
 -- Junction table: Sections can belong to multiple collections
 -- Enables collections by theme (thinai), structure type, etc.
 CREATE TABLE section_collections (
@@ -249,41 +422,6 @@ CREATE TABLE cross_references (
 
 -- Complete hierarchical path for each verse
 CREATE VIEW verse_hierarchy AS
-WITH RECURSIVE section_path AS (
-    SELECT
-        section_id,
-        work_id,
-        parent_section_id,
-        level_type,
-        section_name,
-        section_name_tamil,
-        section_number,
-        sort_order,
-        1 as depth,
-        section_id::TEXT as path,
-        level_type || ':' || section_name as path_names,
-        COALESCE(level_type_tamil, level_type) || ':' || COALESCE(section_name_tamil, section_name) as path_names_tamil
-    FROM sections
-    WHERE parent_section_id IS NULL
-
-    UNION ALL
-
-    SELECT
-        s.section_id,
-        s.work_id,
-        s.parent_section_id,
-        s.level_type,
-        s.section_name,
-        s.section_name_tamil,
-        s.section_number,
-        s.sort_order,
-        sp.depth + 1,
-        sp.path || '/' || s.section_id::TEXT,
-        sp.path_names || ' > ' || s.level_type || ':' || s.section_name,
-        sp.path_names_tamil || ' > ' || COALESCE(s.level_type_tamil, s.level_type) || ':' || COALESCE(s.section_name_tamil, s.section_name)
-    FROM sections s
-    INNER JOIN section_path sp ON s.parent_section_id = sp.section_id
-)
 SELECT
     v.verse_id,
     v.verse_number,
@@ -295,22 +433,15 @@ SELECT
     w.chronology_start_year,
     w.chronology_end_year,
     w.chronology_confidence,
-    sp.path_names as hierarchy_path,
-    sp.path_names_tamil as hierarchy_path_tamil,
+    sp.hierarchy_path,
+    sp.hierarchy_path_tamil,
     sp.depth as hierarchy_depth
 FROM verses v
 INNER JOIN works w ON v.work_id = w.work_id
-INNER JOIN section_path sp ON v.section_id = sp.section_id;
+INNER JOIN section_paths sp ON sp.descendant_id = v.section_id AND sp.distance = 0;
 
 -- Complete word information with full context
 CREATE VIEW word_details AS
-WITH work_verse_counts AS (
-    SELECT
-        work_id,
-        COUNT(DISTINCT verse_id) as work_verse_count
-    FROM verses
-    GROUP BY work_id
-)
 SELECT
     w.word_id,
     w.word_text,
@@ -338,7 +469,7 @@ SELECT
     vh.chronology_confidence,
     vh.hierarchy_path,
     vh.hierarchy_path_tamil,
-    wvc.work_verse_count,  -- Total verses in the work
+    ws.verse_count::BIGINT as work_verse_count,  -- Total verses in the work (work_stats)
     s.sort_order as section_sort_order,  -- Section sort order for hierarchical sorting
     v.sort_order as verse_sort_order     -- Verse sort order for hierarchical sorting
 FROM words w
@@ -346,7 +477,7 @@ INNER JOIN lines l ON w.line_id = l.line_id
 INNER JOIN verses v ON l.verse_id = v.verse_id
 INNER JOIN sections s ON v.section_id = s.section_id
 INNER JOIN verse_hierarchy vh ON v.verse_id = vh.verse_id
-INNER JOIN work_verse_counts wvc ON v.work_id = wvc.work_id;
+LEFT JOIN work_stats ws ON v.work_id = ws.work_id;
 
 -- Removed: works_with_primary_collection view
 -- Use work_collections table for collection relationships instead
@@ -466,6 +597,393 @@ JOIN collections c ON vc.collection_id = c.collection_id
 LEFT JOIN collections pc ON c.parent_collection_id = pc.collection_id
 ORDER BY c.collection_id, vc.position_in_collection;
 
+-- ============================================================================
+-- SEARCH TABLES (derived, maintained by scripts/search_index.py)
+-- ============================================================================
+
+-- Flattened, pre-sorted occurrence table read by /search instead of word_details
+-- One row per word; line_text is joined from lines by line_id
+CREATE TABLE word_occurrences (
+    word_id INTEGER PRIMARY KEY,
+    work_id INTEGER NOT NULL,
+    section_id INTEGER NOT NULL,
+    verse_id INTEGER NOT NULL,
+    line_id INTEGER NOT NULL,  -- Reference for line_text (lines.line_id)
+    word_text VARCHAR(200) NOT NULL,
+    word_text_transliteration VARCHAR(200),
+    word_root VARCHAR(200),
+    word_type VARCHAR(50),
+    word_position INTEGER NOT NULL,
+    sandhi_split VARCHAR(500),
+    meaning TEXT,
+    line_number INTEGER NOT NULL,
+    verse_number INTEGER NOT NULL,
+    verse_type VARCHAR(200),
+    verse_type_tamil VARCHAR(200),
+    total_lines INTEGER,
+    hierarchy_path TEXT,
+    hierarchy_path_tamil TEXT,
+    section_sort_order INTEGER,
+    verse_sort_order INTEGER,
+    work_verse_count INTEGER,  -- Total verses in the work (fixed per import)
+    work_ordinal INTEGER,  -- Position of the word inside its work (hierarchical order)
+    canonical_rank BIGINT,  -- (work_sort_ranks.canonical_rank << 32) | work_ordinal
+    chronological_rank BIGINT,  -- (work_sort_ranks.chronological_rank << 32) | work_ordinal
+    alphabetical_rank BIGINT,  -- (work_sort_ranks.alphabetical_rank << 32) | work_ordinal
+    FOREIGN KEY (work_id) REFERENCES works(work_id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_word_occurrences_work ON word_occurrences(work_id);
+CREATE INDEX idx_word_occurrences_verse ON word_occurrences(verse_id);
+-- One (word_text, rank) index per sort mode: ORDER BY rank LIMIT n is an index range scan
+CREATE INDEX idx_word_occurrences_text_canonical ON word_occurrences(word_text, canonical_rank);
+CREATE INDEX idx_word_occurrences_text_chronological ON word_occurrences(word_text, chronological_rank);
+CREATE INDEX idx_word_occurrences_text_alphabetical ON word_occurrences(word_text, alphabetical_rank);
+-- Substring search indexes (word_position = beginning / end / anywhere); searches
+-- read word_occurrences only, so words has none of these (migrations/020)
+-- Prefix: LIKE 'term%' needs text_pattern_ops unless the database collation is C
+-- Suffix: LIKE '%term' is rewritten as reverse(word_text) LIKE 'mret%'
+-- Infix:  LIKE '%term%' is served by the pg_trgm GIN index
+CREATE INDEX idx_word_occurrences_text_pattern ON word_occurrences (word_text text_pattern_ops);
+CREATE INDEX idx_word_occurrences_text_reverse ON word_occurrences (reverse(word_text) text_pattern_ops);
+CREATE INDEX idx_word_occurrences_text_trgm ON word_occurrences USING GIN (word_text gin_trgm_ops);
+CREATE INDEX idx_word_occurrences_root ON word_occurrences(word_root) WHERE word_root IS NOT NULL;
+
+-- Work-level sort ranks (one row per work), kept current by a trigger on works
+-- Ties are broken by work_id so every work has a distinct rank
+CREATE TABLE work_sort_ranks (
+    work_id INTEGER PRIMARY KEY,
+    canonical_rank INTEGER NOT NULL,
+    chronological_rank INTEGER NOT NULL,
+    alphabetical_rank INTEGER NOT NULL,
+    FOREIGN KEY (work_id) REFERENCES works(work_id) ON DELETE CASCADE
+);
+
+-- Recompute work ranks; update occurrences of works whose rank changed
+CREATE OR REPLACE FUNCTION refresh_work_sort_ranks()
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    WITH ranked AS (
+        SELECT
+            work_id,
+            ROW_NUMBER() OVER (ORDER BY canonical_order ASC NULLS LAST, work_id) AS canonical_rank,
+            ROW_NUMBER() OVER (ORDER BY chronology_start_year ASC NULLS LAST, work_id) AS chronological_rank,
+            ROW_NUMBER() OVER (ORDER BY work_name ASC, work_id) AS alphabetical_rank
+        FROM works
+    ),
+    changed AS (
+        INSERT INTO work_sort_ranks AS r (work_id, canonical_rank, chronological_rank, alphabetical_rank)
+        SELECT work_id, canonical_rank, chronological_rank, alphabetical_rank
+        FROM ranked
+        ON CONFLICT (work_id) DO UPDATE SET
+            canonical_rank = EXCLUDED.canonical_rank,
+            chronological_rank = EXCLUDED.chronological_rank,
+            alphabetical_rank = EXCLUDED.alphabetical_rank
+        WHERE (r.canonical_rank, r.chronological_rank, r.alphabetical_rank)
+              IS DISTINCT FROM
+              (EXCLUDED.canonical_rank, EXCLUDED.chronological_rank, EXCLUDED.alphabetical_rank)
+        RETURNING r.work_id, r.canonical_rank, r.chronological_rank, r.alphabetical_rank
+    )
+    UPDATE word_occurrences o SET
+        canonical_rank = (c.canonical_rank::BIGINT << 32) | o.work_ordinal,
+        chronological_rank = (c.chronological_rank::BIGINT << 32) | o.work_ordinal,
+        alphabetical_rank = (c.alphabetical_rank::BIGINT << 32) | o.work_ordinal
+    FROM changed c
+    WHERE o.work_id = c.work_id;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION trg_works_refresh_sort_ranks()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM refresh_work_sort_ranks();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER works_refresh_sort_ranks
+AFTER INSERT OR DELETE OR UPDATE OF canonical_order, chronology_start_year, work_name ON works
+FOR EACH STATEMENT EXECUTE FUNCTION trg_works_refresh_sort_ranks();
+
+-- Per-work refresh (incremental: only touches one work's rows)
+-- Assigns work_ordinal in hierarchical order and the three sort ranks
+CREATE OR REPLACE FUNCTION refresh_word_occurrences(p_work_id INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    inserted_count INTEGER;
+BEGIN
+    DELETE FROM word_occurrences WHERE work_id = p_work_id;
+
+    INSERT INTO word_occurrences (
+        word_id, work_id, section_id, verse_id, line_id,
+        word_text, word_text_transliteration, word_root, word_type,
+        word_position, sandhi_split, meaning,
+        line_number, verse_number, verse_type, verse_type_tamil, total_lines,
+        hierarchy_path, hierarchy_path_tamil,
+        section_sort_order, verse_sort_order, work_verse_count,
+        work_ordinal, canonical_rank, chronological_rank, alphabetical_rank
+    )
+    SELECT
+        o.*,
+        (r.canonical_rank::BIGINT << 32) | o.work_ordinal,
+        (r.chronological_rank::BIGINT << 32) | o.work_ordinal,
+        (r.alphabetical_rank::BIGINT << 32) | o.work_ordinal
+    FROM (
+        SELECT
+            w.word_id, v.work_id, v.section_id, v.verse_id, l.line_id,
+            w.word_text, w.word_text_transliteration, w.word_root, w.word_type,
+            w.word_position, w.sandhi_split, w.meaning,
+            l.line_number, v.verse_number, v.verse_type, v.verse_type_tamil, v.total_lines,
+            vh.hierarchy_path, vh.hierarchy_path_tamil,
+            s.sort_order AS section_sort_order, v.sort_order AS verse_sort_order,
+            vc.work_verse_count,
+            ROW_NUMBER() OVER (
+                ORDER BY s.sort_order, v.sort_order, l.line_number, w.word_position
+            )::INTEGER AS work_ordinal
+        FROM words w
+        INNER JOIN lines l ON w.line_id = l.line_id
+        INNER JOIN verses v ON l.verse_id = v.verse_id
+        INNER JOIN sections s ON v.section_id = s.section_id
+        INNER JOIN verse_hierarchy vh ON v.verse_id = vh.verse_id
+        CROSS JOIN (
+            SELECT COUNT(*) AS work_verse_count FROM verses WHERE work_id = p_work_id
+        ) vc
+        WHERE v.work_id = p_work_id
+    ) o
+    INNER JOIN work_sort_ranks r ON r.work_id = o.work_id
+    ORDER BY o.work_ordinal;
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN inserted_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Per-work word frequencies behind /search/summary (migrations/014)
+CREATE TABLE word_work_freq (
+    word_text VARCHAR(200) NOT NULL,
+    work_id INTEGER NOT NULL,
+    occurrence_count INTEGER NOT NULL,
+    verse_count INTEGER NOT NULL,  -- Distinct verses of the work containing the word
+    PRIMARY KEY (word_text, work_id),
+    FOREIGN KEY (work_id) REFERENCES works(work_id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_word_work_freq_work_top ON word_work_freq (work_id, occurrence_count DESC, word_text);  -- migrations/017
+CREATE INDEX idx_word_work_freq_text_pattern ON word_work_freq (word_text text_pattern_ops);
+CREATE INDEX idx_word_work_freq_text_reverse ON word_work_freq (reverse(word_text) text_pattern_ops);
+CREATE INDEX idx_word_work_freq_text_trgm ON word_work_freq USING GIN (word_text gin_trgm_ops);
+
+CREATE OR REPLACE FUNCTION refresh_word_work_freq(p_work_id INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    inserted_count INTEGER;
+BEGIN
+    DELETE FROM word_work_freq WHERE work_id = p_work_id;
+
+    INSERT INTO word_work_freq (word_text, work_id, occurrence_count, verse_count)
+    SELECT word_text, work_id, COUNT(*), COUNT(DISTINCT verse_id)
+    FROM word_occurrences
+    WHERE work_id = p_work_id
+    GROUP BY word_text, work_id;
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN inserted_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Per-work root frequencies behind /stats unique_roots and /roots (migrations/019)
+CREATE TABLE root_work_freq (
+    word_root VARCHAR(200) NOT NULL,
+    work_id INTEGER NOT NULL,
+    occurrence_count INTEGER NOT NULL,
+    PRIMARY KEY (word_root, work_id),
+    FOREIGN KEY (work_id) REFERENCES works(work_id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_root_work_freq_work ON root_work_freq(work_id);
+
+CREATE OR REPLACE FUNCTION refresh_root_work_freq(p_work_id INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    inserted_count INTEGER;
+BEGIN
+    DELETE FROM root_work_freq WHERE work_id = p_work_id;
+
+    INSERT INTO root_work_freq (word_root, work_id, occurrence_count)
+    SELECT word_root, work_id, COUNT(*)
+    FROM word_occurrences
+    WHERE work_id = p_work_id AND word_root IS NOT NULL
+    GROUP BY word_root, work_id;
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN inserted_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Verse posting lists behind /search/verses (migrations/018)
+-- work_verse_order.verse_ids[n] is the verse at position n of the work (work_ordinal order)
+CREATE TABLE work_verse_order (
+    work_id INTEGER PRIMARY KEY,
+    verse_ids INTEGER[] NOT NULL,
+    FOREIGN KEY (work_id) REFERENCES works(work_id) ON DELETE CASCADE
+);
+
+CREATE TABLE verse_postings (
+    word_text VARCHAR(200) NOT NULL,
+    work_id INTEGER NOT NULL,
+    verse_positions INTEGER[] NOT NULL,  -- Positions in work_verse_order.verse_ids, ascending
+    PRIMARY KEY (word_text, work_id),
+    FOREIGN KEY (work_id) REFERENCES works(work_id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_verse_postings_work ON verse_postings(work_id);
+
+CREATE OR REPLACE FUNCTION refresh_verse_postings(p_work_id INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    inserted_count INTEGER;
+BEGIN
+    DELETE FROM verse_postings WHERE work_id = p_work_id;
+    DELETE FROM work_verse_order WHERE work_id = p_work_id;
+
+    INSERT INTO work_verse_order (work_id, verse_ids)
+    SELECT p_work_id, COALESCE(array_agg(v.verse_id ORDER BY s.sort_order, v.sort_order, v.verse_id), '{}')
+    FROM verses v
+    JOIN sections s ON s.section_id = v.section_id
+    WHERE v.work_id = p_work_id;
+
+    INSERT INTO verse_postings (word_text, work_id, verse_positions)
+    SELECT o.word_text, p_work_id, array_agg(DISTINCT p.verse_position ORDER BY p.verse_position)
+    FROM word_occurrences o
+    JOIN (
+        SELECT u.verse_id, u.verse_position::INTEGER AS verse_position
+        FROM work_verse_order wv
+        CROSS JOIN LATERAL unnest(wv.verse_ids) WITH ORDINALITY AS u(verse_id, verse_position)
+        WHERE wv.work_id = p_work_id
+    ) p ON p.verse_id = o.verse_id
+    WHERE o.work_id = p_work_id
+    GROUP BY o.word_text;
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN inserted_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Per-word keys: grapheme-cluster keys behind match_type=grapheme (migrations/015)
+-- and Tamil alphabetical sort keys (migrations/016)
+-- Filled by scripts/search_index.py (keys come from scripts/word_cleaning.py)
+CREATE TABLE word_graphemes (
+    word_text VARCHAR(200) PRIMARY KEY,
+    grapheme_key VARCHAR(400) NOT NULL,  -- Every grapheme enclosed in '|'
+    word_sort_key BYTEA  -- Byte order = Tamil alphabet order
+);
+
+CREATE INDEX idx_word_graphemes_key_pattern ON word_graphemes (grapheme_key text_pattern_ops);
+CREATE INDEX idx_word_graphemes_key_reverse ON word_graphemes (reverse(grapheme_key) text_pattern_ops);
+CREATE INDEX idx_word_graphemes_key_trgm ON word_graphemes USING GIN (grapheme_key gin_trgm_ops);
+CREATE INDEX idx_word_graphemes_sort_key ON word_graphemes (word_sort_key);
+
+-- Corpus generation: changes whenever searchable data changes (imports, deletes)
+-- API caches are keyed on it (see webapp/backend/database.py)
+CREATE TABLE corpus_state (
+    state_id INTEGER PRIMARY KEY DEFAULT 1 CHECK (state_id = 1),
+    corpus_generation BIGINT NOT NULL DEFAULT 1,
+    collection_generation BIGINT NOT NULL DEFAULT 1,  -- Bumped by triggers on the collection tables
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO corpus_state (state_id) VALUES (1);
+
+CREATE OR REPLACE FUNCTION bump_corpus_generation()
+RETURNS BIGINT AS $$
+    UPDATE corpus_state
+    SET corpus_generation = corpus_generation + 1,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE state_id = 1
+    RETURNING corpus_generation;
+$$ LANGUAGE sql;
+
+-- Collection generation: changes whenever collections or their assignments change
+-- (migrations/013); with corpus_generation it forms the API's ETags
+CREATE OR REPLACE FUNCTION bump_collection_generation()
+RETURNS BIGINT AS $$
+    UPDATE corpus_state
+    SET collection_generation = collection_generation + 1,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE state_id = 1
+    RETURNING collection_generation;
+$$ LANGUAGE sql;
+
+CREATE OR REPLACE FUNCTION trg_bump_collection_generation()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM bump_collection_generation();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER collections_bump_generation
+AFTER INSERT OR UPDATE OR DELETE ON collections
+FOR EACH STATEMENT EXECUTE FUNCTION trg_bump_collection_generation();
+
+CREATE TRIGGER work_collections_bump_generation
+AFTER INSERT OR UPDATE OR DELETE ON work_collections
+FOR EACH STATEMENT EXECUTE FUNCTION trg_bump_collection_generation();
+
+CREATE TRIGGER section_collections_bump_generation
+AFTER INSERT OR UPDATE OR DELETE ON section_collections
+FOR EACH STATEMENT EXECUTE FUNCTION trg_bump_collection_generation();
+
+CREATE TRIGGER verse_collections_bump_generation
+AFTER INSERT OR UPDATE OR DELETE ON verse_collections
+FOR EACH STATEMENT EXECUTE FUNCTION trg_bump_collection_generation();
+
+-- /stats snapshot, refreshed after imports and when its generation is stale
+-- (scripts/search_index.py, webapp/backend/database.py)
+CREATE TABLE corpus_stats (
+    state_id INTEGER PRIMARY KEY DEFAULT 1 CHECK (state_id = 1),
+    total_works INTEGER NOT NULL,
+    total_verses BIGINT NOT NULL,
+    total_lines BIGINT NOT NULL,
+    total_words BIGINT NOT NULL,
+    distinct_words BIGINT NOT NULL,
+    unique_roots BIGINT NOT NULL,
+    corpus_generation BIGINT NOT NULL,  -- corpus_state generation the numbers belong to
+    refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE OR REPLACE FUNCTION refresh_corpus_stats()
+RETURNS VOID AS $$
+    INSERT INTO corpus_stats (
+        state_id, total_works, total_verses, total_lines, total_words,
+        distinct_words, unique_roots, corpus_generation, refreshed_at
+    )
+    SELECT
+        1,
+        (SELECT COUNT(*) FROM works),
+        (SELECT COALESCE(SUM(verse_count), 0) FROM work_stats),
+        (SELECT COALESCE(SUM(line_count), 0) FROM work_stats),
+        (SELECT COALESCE(SUM(word_count), 0) FROM work_stats),
+        (SELECT COUNT(DISTINCT word_text) FROM word_work_freq),
+        (SELECT COUNT(DISTINCT word_root) FROM root_work_freq),
+        (SELECT corpus_generation FROM corpus_state WHERE state_id = 1),
+        CURRENT_TIMESTAMP
+    ON CONFLICT (state_id) DO UPDATE SET
+        total_works = EXCLUDED.total_works,
+        total_verses = EXCLUDED.total_verses,
+        total_lines = EXCLUDED.total_lines,
+        total_words = EXCLUDED.total_words,
+        distinct_words = EXCLUDED.distinct_words,
+        unique_roots = EXCLUDED.unique_roots,
+        corpus_generation = EXCLUDED.corpus_generation,
+        refreshed_at = EXCLUDED.refreshed_at;
+$$ LANGUAGE sql;
+
 -- ============================================================================
 -- COMMON QUERY EXAMPLES
 -- ============================================================================
@@ -5,6 +5,33 @@
 DROP VIEW IF EXISTS word_details CASCADE;
 DROP VIEW IF EXISTS verse_hierarchy CASCADE;
 
+-- Drop derived search tables and functions
+DROP TABLE IF EXISTS word_occurrences CASCADE;
+DROP TABLE IF EXISTS work_sort_ranks CASCADE;
+DROP FUNCTION IF EXISTS refresh_word_occurrences(INTEGER);
+DROP FUNCTION IF EXISTS trg_works_refresh_sort_ranks() CASCADE;
+DROP FUNCTION IF EXISTS refresh_work_sort_ranks();
+DROP TABLE IF EXISTS corpus_state CASCADE;
+DROP FUNCTION IF EXISTS bump_corpus_generation();
+DROP FUNCTION IF EXISTS trg_bump_collection_generation() CASCADE;
+DROP FUNCTION IF EXISTS bump_collection_generation();
+DROP TABLE IF EXISTS section_paths CASCADE;
+DROP FUNCTION IF EXISTS trg_sections_insert_paths() CASCADE;
+DROP FUNCTION IF EXISTS trg_sections_update_paths() CASCADE;
+DROP FUNCTION IF EXISTS refresh_section_paths(INTEGER);
+DROP TABLE IF EXISTS work_stats CASCADE;
+DROP FUNCTION IF EXISTS refresh_work_stats(INTEGER);
+DROP TABLE IF EXISTS corpus_stats CASCADE;
+DROP FUNCTION IF EXISTS refresh_corpus_stats();
+DROP TABLE IF EXISTS word_work_freq CASCADE;
+DROP FUNCTION IF EXISTS refresh_word_work_freq(INTEGER);
+DROP TABLE IF EXISTS root_work_freq CASCADE;
+DROP FUNCTION IF EXISTS refresh_root_work_freq(INTEGER);
+DROP TABLE IF EXISTS word_graphemes CASCADE;
+DROP TABLE IF EXISTS verse_postings CASCADE;
+DROP TABLE IF EXISTS work_verse_order CASCADE;
+DROP FUNCTION IF EXISTS refresh_verse_postings(INTEGER);
+
 -- Drop tables in reverse order of dependencies
 DROP TABLE IF EXISTS cross_references CASCADE;
 DROP TABLE IF EXISTS commentaries CASCADE;
@@ -0,0 +1,48 @@
+-- Migration: Add trigram and reversed-text indexes for substring searches
+-- Date: 2026-10-16
+-- Purpose: Serve word_position=end|anywhere searches from an index instead of a
+--          sequential scan of the whole words table
+-- Impact: search_words now filters "end" searches on reverse(word_text) LIKE 'mret%'
+--         and "anywhere" searches use the trigram GIN index for word_text LIKE '%term%'
+
+-- 1. pg_trgm extension (available on Railway and Neon)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 2. Trigram GIN index for "anywhere" (infix) searches
+-- Used automatically by the planner for word_text LIKE '%term%'
+CREATE INDEX IF NOT EXISTS idx_words_text_trgm
+ON words USING GIN (word_text gin_trgm_ops);
+
+-- 3. Reversed-text btree for "end" (suffix) searches
+-- A suffix match on word_text is a prefix match on reverse(word_text).
+-- text_pattern_ops lets LIKE 'prefix%' use the index regardless of the
+-- database collation (Railway/Neon are usually en_US.UTF-8, not C).
+CREATE INDEX IF NOT EXISTS idx_words_text_reverse
+ON words (reverse(word_text) text_pattern_ops);
+
+-- 4. Pattern btree for "beginning" (prefix) searches
+-- idx_words_text uses the default collation and cannot serve LIKE 'term%'
+-- unless the database collation is C.
+CREATE INDEX IF NOT EXISTS idx_words_text_pattern
+ON words (word_text text_pattern_ops);
+
+ANALYZE words;
+
+-- Verify indexes were created
+SELECT
+    schemaname,
+    tablename,
+    indexname,
+    indexdef
+FROM pg_indexes
+WHERE indexname IN (
+    'idx_words_text_trgm',
+    'idx_words_text_reverse',
+    'idx_words_text_pattern'
+)
+ORDER BY tablename, indexname;
+
+-- Performance notes:
+-- - Measure with: python scripts/benchmark_suffix_search.py
+-- - Trigram lookups need at least 3 characters to be selective; for shorter
+--   "anywhere" terms the planner may still prefer a sequential scan
@@ -0,0 +1,104 @@
+-- Migration: Add flattened word_occurrences search table
+-- Date: 2026-10-16
+-- Purpose: Serve /search from a denormalized, pre-sorted table instead of the
+--          word_details view (words → lines → verses → sections → verse_hierarchy
+--          plus the work_verse_counts CTE on every request)
+-- Impact: search_words reads word_occurrences joined only to works (tiny) and
+--         lines (by primary key, for line_text)
+--
+-- Maintenance:
+--   - Importers call refresh_word_occurrences(work_id) via scripts/search_index.py
+--   - delete scripts remove a work's rows before deleting its words
+--   - Full rebuild: python scripts/search_index.py --all
+
+-- 1. Occurrence table (one row per word)
+CREATE TABLE IF NOT EXISTS word_occurrences (
+    word_id INTEGER PRIMARY KEY,
+    work_id INTEGER NOT NULL,
+    section_id INTEGER NOT NULL,
+    verse_id INTEGER NOT NULL,
+    line_id INTEGER NOT NULL,  -- Reference for line_text (lines.line_id)
+    word_text VARCHAR(200) NOT NULL,
+    word_text_transliteration VARCHAR(200),
+    word_root VARCHAR(200),
+    word_type VARCHAR(50),
+    word_position INTEGER NOT NULL,
+    sandhi_split VARCHAR(500),
+    meaning TEXT,
+    line_number INTEGER NOT NULL,
+    verse_number INTEGER NOT NULL,
+    verse_type VARCHAR(200),
+    verse_type_tamil VARCHAR(200),
+    total_lines INTEGER,
+    hierarchy_path TEXT,
+    hierarchy_path_tamil TEXT,
+    section_sort_order INTEGER,
+    verse_sort_order INTEGER,
+    work_verse_count INTEGER,  -- Total verses in the work (fixed per import)
+    FOREIGN KEY (work_id) REFERENCES works(work_id) ON DELETE CASCADE
+);
+
+-- 2. Indexes (same search paths as the words table, see 006)
+CREATE INDEX IF NOT EXISTS idx_word_occurrences_work ON word_occurrences(work_id);
+CREATE INDEX IF NOT EXISTS idx_word_occurrences_verse ON word_occurrences(verse_id);
+CREATE INDEX IF NOT EXISTS idx_word_occurrences_text ON word_occurrences(word_text);
+CREATE INDEX IF NOT EXISTS idx_word_occurrences_text_pattern
+ON word_occurrences (word_text text_pattern_ops);
+CREATE INDEX IF NOT EXISTS idx_word_occurrences_text_reverse
+ON word_occurrences (reverse(word_text) text_pattern_ops);
+CREATE INDEX IF NOT EXISTS idx_word_occurrences_text_trgm
+ON word_occurrences USING GIN (word_text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_word_occurrences_root
+ON word_occurrences(word_root) WHERE word_root IS NOT NULL;
+
+-- 3. Per-work refresh (incremental: only touches one work's rows)
+-- Rows are inserted in hierarchical order so each work is stored pre-sorted
+CREATE OR REPLACE FUNCTION refresh_word_occurrences(p_work_id INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    inserted_count INTEGER;
+BEGIN
+    DELETE FROM word_occurrences WHERE work_id = p_work_id;
+
+    INSERT INTO word_occurrences (
+        word_id, work_id, section_id, verse_id, line_id,
+        word_text, word_text_transliteration, word_root, word_type,
+        word_position, sandhi_split, meaning,
+        line_number, verse_number, verse_type, verse_type_tamil, total_lines,
+        hierarchy_path, hierarchy_path_tamil,
+        section_sort_order, verse_sort_order, work_verse_count
+    )
+    SELECT
+        w.word_id, v.work_id, v.section_id, v.verse_id, l.line_id,
+        w.word_text, w.word_text_transliteration, w.word_root, w.word_type,
+        w.word_position, w.sandhi_split, w.meaning,
+        l.line_number, v.verse_number, v.verse_type, v.verse_type_tamil, v.total_lines,
+        vh.hierarchy_path, vh.hierarchy_path_tamil,
+        s.sort_order, v.sort_order, vc.work_verse_count
+    FROM words w
+    INNER JOIN lines l ON w.line_id = l.line_id
+    INNER JOIN verses v ON l.verse_id = v.verse_id
+    INNER JOIN sections s ON v.section_id = s.section_id
+    INNER JOIN verse_hierarchy vh ON v.verse_id = vh.verse_id
+    CROSS JOIN (
+        SELECT COUNT(*) AS work_verse_count FROM verses WHERE work_id = p_work_id
+    ) vc
+    WHERE v.work_id = p_work_id
+    ORDER BY s.sort_order, v.sort_order, l.line_number, w.word_position;
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN inserted_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 4. Backfill every existing work
+SELECT work_id, refresh_word_occurrences(work_id) AS occurrences
+FROM works
+ORDER BY work_id;
+
+ANALYZE word_occurrences;
+
+-- Verify: occurrence count should match words count
+SELECT
+    (SELECT COUNT(*) FROM words) AS words,
+    (SELECT COUNT(*) FROM word_occurrences) AS word_occurrences;
@@ -0,0 +1,161 @@
+-- Migration: Precomputed sort ranks on word_occurrences
+-- Date: 2026-10-16
+-- Purpose: Let /search ORDER BY a single integer per sort mode instead of
+--          (work sort field, section_sort_order, verse_sort_order, line_number, word_position)
+-- Impact: WHERE word_text = %s ORDER BY canonical_rank LIMIT 100 is an index range
+--         scan on (word_text, canonical_rank) - no sort of all matching rows
+--
+-- Rank layout (BIGINT):
+--   (work rank << 32) | work_ordinal
+--   work rank    = position of the work in that sort mode (work_sort_ranks)
+--   work_ordinal = position of the word inside its work (hierarchical order)
+--
+-- Maintenance:
+--   - refresh_word_occurrences(work_id) fills work_ordinal and the three ranks
+--   - A statement trigger on works recomputes work_sort_ranks when canonical_order,
+--     chronology_start_year or work_name change (or works are added/removed) and
+--     rewrites the ranks of only the works whose position moved
+
+-- 1. Work-level ranks (one row per work)
+CREATE TABLE IF NOT EXISTS work_sort_ranks (
+    work_id INTEGER PRIMARY KEY,
+    canonical_rank INTEGER NOT NULL,
+    chronological_rank INTEGER NOT NULL,
+    alphabetical_rank INTEGER NOT NULL,
+    FOREIGN KEY (work_id) REFERENCES works(work_id) ON DELETE CASCADE
+);
+
+-- 2. Occurrence-level ranks
+ALTER TABLE word_occurrences ADD COLUMN IF NOT EXISTS work_ordinal INTEGER;
+ALTER TABLE word_occurrences ADD COLUMN IF NOT EXISTS canonical_rank BIGINT;
+ALTER TABLE word_occurrences ADD COLUMN IF NOT EXISTS chronological_rank BIGINT;
+ALTER TABLE word_occurrences ADD COLUMN IF NOT EXISTS alphabetical_rank BIGINT;
+
+-- 3. Recompute work ranks; update occurrences of works whose rank changed
+-- Ties are broken by work_id so every work has a distinct rank
+CREATE OR REPLACE FUNCTION refresh_work_sort_ranks()
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    WITH ranked AS (
+        SELECT
+            work_id,
+            ROW_NUMBER() OVER (ORDER BY canonical_order ASC NULLS LAST, work_id) AS canonical_rank,
+            ROW_NUMBER() OVER (ORDER BY chronology_start_year ASC NULLS LAST, work_id) AS chronological_rank,
+            ROW_NUMBER() OVER (ORDER BY work_name ASC, work_id) AS alphabetical_rank
+        FROM works
+    ),
+    changed AS (
+        INSERT INTO work_sort_ranks AS r (work_id, canonical_rank, chronological_rank, alphabetical_rank)
+        SELECT work_id, canonical_rank, chronological_rank, alphabetical_rank
+        FROM ranked
+        ON CONFLICT (work_id) DO UPDATE SET
+            canonical_rank = EXCLUDED.canonical_rank,
+            chronological_rank = EXCLUDED.chronological_rank,
+            alphabetical_rank = EXCLUDED.alphabetical_rank
+        WHERE (r.canonical_rank, r.chronological_rank, r.alphabetical_rank)
+              IS DISTINCT FROM
+              (EXCLUDED.canonical_rank, EXCLUDED.chronological_rank, EXCLUDED.alphabetical_rank)
+        RETURNING r.work_id, r.canonical_rank, r.chronological_rank, r.alphabetical_rank
+    )
+    UPDATE word_occurrences o SET
+        canonical_rank = (c.canonical_rank::BIGINT << 32) | o.work_ordinal,
+        chronological_rank = (c.chronological_rank::BIGINT << 32) | o.work_ordinal,
+        alphabetical_rank = (c.alphabetical_rank::BIGINT << 32) | o.work_ordinal
+    FROM changed c
+    WHERE o.work_id = c.work_id;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION trg_works_refresh_sort_ranks()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM refresh_work_sort_ranks();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS works_refresh_sort_ranks ON works;
+CREATE TRIGGER works_refresh_sort_ranks
+AFTER INSERT OR DELETE OR UPDATE OF canonical_order, chronology_start_year, work_name ON works
+FOR EACH STATEMENT EXECUTE FUNCTION trg_works_refresh_sort_ranks();
+
+-- 4. Per-work refresh now also assigns work_ordinal and the three ranks
+CREATE OR REPLACE FUNCTION refresh_word_occurrences(p_work_id INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    inserted_count INTEGER;
+BEGIN
+    DELETE FROM word_occurrences WHERE work_id = p_work_id;
+
+    INSERT INTO word_occurrences (
+        word_id, work_id, section_id, verse_id, line_id,
+        word_text, word_text_transliteration, word_root, word_type,
+        word_position, sandhi_split, meaning,
+        line_number, verse_number, verse_type, verse_type_tamil, total_lines,
+        hierarchy_path, hierarchy_path_tamil,
+        section_sort_order, verse_sort_order, work_verse_count,
+        work_ordinal, canonical_rank, chronological_rank, alphabetical_rank
+    )
+    SELECT
+        o.*,
+        (r.canonical_rank::BIGINT << 32) | o.work_ordinal,
+        (r.chronological_rank::BIGINT << 32) | o.work_ordinal,
+        (r.alphabetical_rank::BIGINT << 32) | o.work_ordinal
+    FROM (
+        SELECT
+            w.word_id, v.work_id, v.section_id, v.verse_id, l.line_id,
+            w.word_text, w.word_text_transliteration, w.word_root, w.word_type,
+            w.word_position, w.sandhi_split, w.meaning,
+            l.line_number, v.verse_number, v.verse_type, v.verse_type_tamil, v.total_lines,
+            vh.hierarchy_path, vh.hierarchy_path_tamil,
+            s.sort_order AS section_sort_order, v.sort_order AS verse_sort_order,
+            vc.work_verse_count,
+            ROW_NUMBER() OVER (
+                ORDER BY s.sort_order, v.sort_order, l.line_number, w.word_position
+            )::INTEGER AS work_ordinal
+        FROM words w
+        INNER JOIN lines l ON w.line_id = l.line_id
+        INNER JOIN verses v ON l.verse_id = v.verse_id
+        INNER JOIN sections s ON v.section_id = s.section_id
+        INNER JOIN verse_hierarchy vh ON v.verse_id = vh.verse_id
+        CROSS JOIN (
+            SELECT COUNT(*) AS work_verse_count FROM verses WHERE work_id = p_work_id
+        ) vc
+        WHERE v.work_id = p_work_id
+    ) o
+    INNER JOIN work_sort_ranks r ON r.work_id = o.work_id
+    ORDER BY o.work_ordinal;
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN inserted_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 5. Indexes: one (word_text, rank) index per sort mode
+-- idx_word_occurrences_text is superseded by these composite indexes
+CREATE INDEX IF NOT EXISTS idx_word_occurrences_text_canonical
+ON word_occurrences(word_text, canonical_rank);
+CREATE INDEX IF NOT EXISTS idx_word_occurrences_text_chronological
+ON word_occurrences(word_text, chronological_rank);
+CREATE INDEX IF NOT EXISTS idx_word_occurrences_text_alphabetical
+ON word_occurrences(word_text, alphabetical_rank);
+DROP INDEX IF EXISTS idx_word_occurrences_text;
+
+-- 6. Backfill: rank every work, then rebuild every work's occurrences
+SELECT refresh_work_sort_ranks();
+
+SELECT work_id, refresh_word_occurrences(work_id) AS occurrences
+FROM works
+ORDER BY work_id;
+
+ANALYZE word_occurrences;
+
+-- Verify: no occurrence should be left without ranks
+SELECT COUNT(*) AS unranked_occurrences
+FROM word_occurrences
+WHERE canonical_rank IS NULL OR chronological_rank IS NULL OR alphabetical_rank IS NULL;
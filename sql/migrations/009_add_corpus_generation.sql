@@ -0,0 +1,33 @@
+-- Migration: Corpus generation counter
+-- Date: 2026-10-16
+-- Purpose: A single number that changes whenever searchable data changes, so the
+--          API can key in-process caches (e.g. search result counts) on it and
+--          never serve a count from before an import or delete
+--
+-- Maintenance:
+--   - scripts/search_index.py bumps the generation whenever a work's search rows
+--     are refreshed or removed (i.e. on every import and delete)
+--   - The API polls corpus_state at most every CORPUS_GENERATION_POLL_SECONDS
+
+-- 1. Single-row state table
+CREATE TABLE IF NOT EXISTS corpus_state (
+    state_id INTEGER PRIMARY KEY DEFAULT 1 CHECK (state_id = 1),
+    corpus_generation BIGINT NOT NULL DEFAULT 1,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO corpus_state (state_id) VALUES (1)
+ON CONFLICT (state_id) DO NOTHING;
+
+-- 2. Bump function (returns the new generation)
+CREATE OR REPLACE FUNCTION bump_corpus_generation()
+RETURNS BIGINT AS $$
+    UPDATE corpus_state
+    SET corpus_generation = corpus_generation + 1,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE state_id = 1
+    RETURNING corpus_generation;
+$$ LANGUAGE sql;
+
+-- Verify
+SELECT * FROM corpus_state;
@@ -0,0 +1,186 @@
+-- Migration: Section path closure table
+-- Date: 2026-10-16
+-- Purpose: verse_hierarchy rebuilt every section's path with WITH RECURSIVE over
+--          all of sections each time it was referenced (word_details,
+--          /verse/{id}, refresh_word_occurrences). section_paths stores the
+--          ancestor/descendant closure and each section's path strings once.
+-- Impact: verse_hierarchy for one verse is an index lookup on section_paths
+--         instead of a recursive walk of every section in the corpus
+--
+-- Layout:
+--   One row per (ancestor, descendant) pair, including the section itself
+--   (distance 0). The self row (distance = 0) also carries the section's depth
+--   and hierarchy_path / hierarchy_path_tamil; they are NULL on other rows.
+--
+-- Maintenance:
+--   - INSERT on sections: a row trigger adds the new section's rows from its
+--     parent's rows (parents are always inserted first)
+--   - UPDATE on sections: a statement trigger rebuilds the works whose parent
+--     links or level/section names changed (refresh_section_paths)
+--   - DELETE on sections: rows cascade through the foreign keys
+--   - scripts/search_index.py also rebuilds a work's paths on every import
+
+-- 1. Closure table
+CREATE TABLE IF NOT EXISTS section_paths (
+    ancestor_id INTEGER NOT NULL,
+    descendant_id INTEGER NOT NULL,
+    distance INTEGER NOT NULL,  -- 0 for the section itself, 1 for its parent, ...
+    depth INTEGER,  -- Self row only: 1 for top-level sections
+    hierarchy_path TEXT,  -- Self row only: 'level:name > level:name'
+    hierarchy_path_tamil TEXT,
+    PRIMARY KEY (ancestor_id, descendant_id),
+    FOREIGN KEY (ancestor_id) REFERENCES sections(section_id) ON DELETE CASCADE,
+    FOREIGN KEY (descendant_id) REFERENCES sections(section_id) ON DELETE CASCADE
+);
+
+-- Ancestors of a section, and its self row (descendant_id = x AND distance = 0)
+CREATE INDEX IF NOT EXISTS idx_section_paths_descendant ON section_paths(descendant_id, distance);
+
+-- 2. Rebuild one work's paths (same path strings as the former recursive view)
+CREATE OR REPLACE FUNCTION refresh_section_paths(p_work_id INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    inserted_count INTEGER;
+BEGIN
+    DELETE FROM section_paths sp
+    USING sections s
+    WHERE sp.descendant_id = s.section_id AND s.work_id = p_work_id;
+
+    WITH RECURSIVE section_path AS (
+        SELECT
+            section_id,
+            1 AS depth,
+            ARRAY[section_id] AS ancestors,
+            level_type || ':' || section_name AS path_names,
+            COALESCE(level_type_tamil, level_type) || ':' || COALESCE(section_name_tamil, section_name) AS path_names_tamil
+        FROM sections
+        WHERE work_id = p_work_id AND parent_section_id IS NULL
+
+        UNION ALL
+
+        SELECT
+            s.section_id,
+            sp.depth + 1,
+            sp.ancestors || s.section_id,
+            sp.path_names || ' > ' || s.level_type || ':' || s.section_name,
+            sp.path_names_tamil || ' > ' || COALESCE(s.level_type_tamil, s.level_type) || ':' || COALESCE(s.section_name_tamil, s.section_name)
+        FROM sections s
+        INNER JOIN section_path sp ON s.parent_section_id = sp.section_id
+    )
+    INSERT INTO section_paths (ancestor_id, descendant_id, distance, depth, hierarchy_path, hierarchy_path_tamil)
+    SELECT
+        a.ancestor_id,
+        sp.section_id,
+        sp.depth - a.position::INTEGER,
+        CASE WHEN a.position = sp.depth THEN sp.depth END,
+        CASE WHEN a.position = sp.depth THEN sp.path_names END,
+        CASE WHEN a.position = sp.depth THEN sp.path_names_tamil END
+    FROM section_path sp
+    CROSS JOIN LATERAL unnest(sp.ancestors) WITH ORDINALITY AS a(ancestor_id, position);
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN inserted_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 3. Triggers on sections
+CREATE OR REPLACE FUNCTION trg_sections_insert_paths()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Self row: parent's path extended by this section
+    INSERT INTO section_paths (ancestor_id, descendant_id, distance, depth, hierarchy_path, hierarchy_path_tamil)
+    SELECT
+        NEW.section_id,
+        NEW.section_id,
+        0,
+        COALESCE(p.depth, 0) + 1,
+        CASE WHEN NEW.parent_section_id IS NULL
+            THEN NEW.level_type || ':' || NEW.section_name
+            ELSE p.hierarchy_path || ' > ' || NEW.level_type || ':' || NEW.section_name
+        END,
+        CASE WHEN NEW.parent_section_id IS NULL
+            THEN COALESCE(NEW.level_type_tamil, NEW.level_type) || ':' || COALESCE(NEW.section_name_tamil, NEW.section_name)
+            ELSE p.hierarchy_path_tamil || ' > ' || COALESCE(NEW.level_type_tamil, NEW.level_type) || ':' || COALESCE(NEW.section_name_tamil, NEW.section_name)
+        END
+    FROM (SELECT 1) AS one
+    LEFT JOIN section_paths p
+        ON p.descendant_id = NEW.parent_section_id AND p.distance = 0;
+
+    -- Every ancestor of the parent (including the parent) is an ancestor of this section
+    INSERT INTO section_paths (ancestor_id, descendant_id, distance)
+    SELECT ancestor_id, NEW.section_id, distance + 1
+    FROM section_paths
+    WHERE descendant_id = NEW.parent_section_id;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION trg_sections_update_paths()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Moving or renaming a section changes the paths of its whole subtree;
+    -- rebuilding the affected works is simpler and still only touches those works
+    PERFORM refresh_section_paths(changed.work_id)
+    FROM (
+        SELECT n.work_id
+        FROM new_rows n
+        INNER JOIN old_rows o ON o.section_id = n.section_id
+        WHERE (n.work_id, n.parent_section_id, n.level_type, n.level_type_tamil, n.section_name, n.section_name_tamil)
+              IS DISTINCT FROM
+              (o.work_id, o.parent_section_id, o.level_type, o.level_type_tamil, o.section_name, o.section_name_tamil)
+        UNION
+        SELECT o.work_id
+        FROM new_rows n
+        INNER JOIN old_rows o ON o.section_id = n.section_id
+        WHERE n.work_id IS DISTINCT FROM o.work_id
+    ) changed;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS sections_insert_paths ON sections;
+CREATE TRIGGER sections_insert_paths
+AFTER INSERT ON sections
+FOR EACH ROW EXECUTE FUNCTION trg_sections_insert_paths();
+
+-- Transition tables cannot be combined with an UPDATE OF column list, so the
+-- function compares old and new rows itself
+DROP TRIGGER IF EXISTS sections_update_paths ON sections;
+CREATE TRIGGER sections_update_paths
+AFTER UPDATE ON sections
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION trg_sections_update_paths();
+
+-- 4. Backfill every work
+SELECT work_id, refresh_section_paths(work_id) AS section_path_rows
+FROM works
+ORDER BY work_id;
+
+ANALYZE section_paths;
+
+-- 5. verse_hierarchy over section_paths (same columns; word_details is unchanged)
+CREATE OR REPLACE VIEW verse_hierarchy AS
+SELECT
+    v.verse_id,
+    v.verse_number,
+    v.verse_type,
+    v.verse_type_tamil,
+    w.work_name,
+    w.work_name_tamil,
+    w.canonical_order as canonical_position,  -- Direct from works table
+    w.chronology_start_year,
+    w.chronology_end_year,
+    w.chronology_confidence,
+    sp.hierarchy_path,
+    sp.hierarchy_path_tamil,
+    sp.depth as hierarchy_depth
+FROM verses v
+INNER JOIN works w ON v.work_id = w.work_id
+INNER JOIN section_paths sp ON sp.descendant_id = v.section_id AND sp.distance = 0;
+
+-- Verify: every section has exactly one self row
+SELECT
+    (SELECT COUNT(*) FROM sections) AS sections,
+    (SELECT COUNT(*) FROM section_paths WHERE distance = 0) AS section_self_rows;
@@ -0,0 +1,101 @@
+-- Migration: Per-work aggregate counts
+-- Date: 2026-10-16
+-- Purpose: word_details and /verse/{id} computed COUNT(DISTINCT verse_id) ...
+--          GROUP BY work_id over the whole verses table on every call to show
+--          one number, and /stats counted every verse, line and word.
+--          work_stats stores those counts once per work.
+--
+-- Maintenance:
+--   - scripts/search_index.py refreshes a work's row at the end of every import
+--     (refresh_work_stats) and removes it when a work is deleted
+--   - Rows also cascade away with their work
+
+-- 1. Aggregates table (one row per work)
+CREATE TABLE IF NOT EXISTS work_stats (
+    work_id INTEGER PRIMARY KEY,
+    verse_count INTEGER NOT NULL DEFAULT 0,
+    line_count INTEGER NOT NULL DEFAULT 0,
+    word_count INTEGER NOT NULL DEFAULT 0,
+    distinct_word_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (work_id) REFERENCES works(work_id) ON DELETE CASCADE
+);
+
+-- 2. Recompute one work's counts (verses/lines/words of that work only)
+CREATE OR REPLACE FUNCTION refresh_work_stats(p_work_id INTEGER)
+RETURNS VOID AS $$
+    INSERT INTO work_stats AS ws (work_id, verse_count, line_count, word_count, distinct_word_count, updated_at)
+    SELECT
+        p_work_id,
+        (SELECT COUNT(*) FROM verses WHERE work_id = p_work_id),
+        (SELECT COUNT(*)
+         FROM lines l
+         INNER JOIN verses v ON l.verse_id = v.verse_id
+         WHERE v.work_id = p_work_id),
+        word_totals.word_count,
+        word_totals.distinct_word_count
+    FROM (
+        SELECT COUNT(*) AS word_count, COUNT(DISTINCT w.word_text) AS distinct_word_count
+        FROM words w
+        INNER JOIN lines l ON w.line_id = l.line_id
+        INNER JOIN verses v ON l.verse_id = v.verse_id
+        WHERE v.work_id = p_work_id
+    ) word_totals
+    ON CONFLICT (work_id) DO UPDATE SET
+        verse_count = EXCLUDED.verse_count,
+        line_count = EXCLUDED.line_count,
+        word_count = EXCLUDED.word_count,
+        distinct_word_count = EXCLUDED.distinct_word_count,
+        updated_at = CURRENT_TIMESTAMP;
+$$ LANGUAGE sql;
+
+-- 3. Backfill every work
+SELECT refresh_work_stats(work_id)
+FROM works
+ORDER BY work_id;
+
+-- 4. word_details reads the stored verse count (same columns as before)
+CREATE OR REPLACE VIEW word_details AS
+SELECT
+    w.word_id,
+    w.word_text,
+    w.word_text_transliteration,
+    w.word_root,
+    w.word_type,
+    w.word_position,
+    w.sandhi_split,
+    w.meaning,
+    l.line_id,
+    l.line_number,
+    l.line_text,
+    v.verse_id,
+    v.verse_number,
+    v.work_id,  -- Work ID for efficient JOINs
+    v.section_id,  -- Section ID for efficient JOINs
+    v.total_lines,  -- Total lines in this verse
+    vh.verse_type,
+    vh.verse_type_tamil,
+    vh.work_name,
+    vh.work_name_tamil,
+    vh.canonical_position,  -- From works.canonical_order (via verse_hierarchy view)
+    vh.chronology_start_year,
+    vh.chronology_end_year,
+    vh.chronology_confidence,
+    vh.hierarchy_path,
+    vh.hierarchy_path_tamil,
+    ws.verse_count::BIGINT as work_verse_count,  -- Total verses in the work (work_stats)
+    s.sort_order as section_sort_order,  -- Section sort order for hierarchical sorting
+    v.sort_order as verse_sort_order     -- Verse sort order for hierarchical sorting
+FROM words w
+INNER JOIN lines l ON w.line_id = l.line_id
+INNER JOIN verses v ON l.verse_id = v.verse_id
+INNER JOIN sections s ON v.section_id = s.section_id
+INNER JOIN verse_hierarchy vh ON v.verse_id = vh.verse_id
+LEFT JOIN work_stats ws ON v.work_id = ws.work_id;
+
+-- Verify: stored verse counts match the verses table
+SELECT
+    (SELECT COUNT(*) FROM works) AS works,
+    (SELECT COUNT(*) FROM work_stats) AS works_with_stats,
+    (SELECT COALESCE(SUM(verse_count), 0) FROM work_stats) AS stored_verses,
+    (SELECT COUNT(*) FROM verses) AS verses;
@@ -0,0 +1,57 @@
+-- Migration: Corpus statistics snapshot
+-- Date: 2026-10-16
+-- Purpose: /stats (and formerly /health) ran COUNT(*) over words/lines/verses and
+--          COUNT(DISTINCT word_text) / COUNT(DISTINCT word_root) over all of
+--          words on every call. corpus_stats keeps the last computed numbers.
+--
+-- Maintenance:
+--   - scripts/search_index.py refreshes the snapshot after every import
+--   - The API refreshes it when its corpus_generation is older than the current
+--     one (e.g. after a delete), and on /admin/stats?fresh=true
+
+-- 1. Single-row snapshot table
+CREATE TABLE IF NOT EXISTS corpus_stats (
+    state_id INTEGER PRIMARY KEY DEFAULT 1 CHECK (state_id = 1),
+    total_works INTEGER NOT NULL,
+    total_verses BIGINT NOT NULL,
+    total_lines BIGINT NOT NULL,
+    total_words BIGINT NOT NULL,
+    distinct_words BIGINT NOT NULL,
+    unique_roots BIGINT NOT NULL,
+    corpus_generation BIGINT NOT NULL,  -- corpus_state generation the numbers belong to
+    refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 2. Recompute the snapshot (per-work totals come from work_stats)
+CREATE OR REPLACE FUNCTION refresh_corpus_stats()
+RETURNS VOID AS $$
+    INSERT INTO corpus_stats (
+        state_id, total_works, total_verses, total_lines, total_words,
+        distinct_words, unique_roots, corpus_generation, refreshed_at
+    )
+    SELECT
+        1,
+        (SELECT COUNT(*) FROM works),
+        (SELECT COALESCE(SUM(verse_count), 0) FROM work_stats),
+        (SELECT COALESCE(SUM(line_count), 0) FROM work_stats),
+        (SELECT COALESCE(SUM(word_count), 0) FROM work_stats),
+        (SELECT COUNT(DISTINCT word_text) FROM words),
+        (SELECT COUNT(DISTINCT word_root) FROM words WHERE word_root IS NOT NULL),
+        (SELECT corpus_generation FROM corpus_state WHERE state_id = 1),
+        CURRENT_TIMESTAMP
+    ON CONFLICT (state_id) DO UPDATE SET
+        total_works = EXCLUDED.total_works,
+        total_verses = EXCLUDED.total_verses,
+        total_lines = EXCLUDED.total_lines,
+        total_words = EXCLUDED.total_words,
+        distinct_words = EXCLUDED.distinct_words,
+        unique_roots = EXCLUDED.unique_roots,
+        corpus_generation = EXCLUDED.corpus_generation,
+        refreshed_at = EXCLUDED.refreshed_at;
+$$ LANGUAGE sql;
+
+-- 3. Initial snapshot
+SELECT refresh_corpus_stats();
+
+-- Verify
+SELECT * FROM corpus_stats;
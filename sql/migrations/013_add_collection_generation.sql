@@ -0,0 +1,57 @@
+-- Migration: Collection generation counter
+-- Date: 2026-10-16
+-- Purpose: /collections, /collections/tree and /collections/{id}/works change when
+--          collections or their work assignments change, which the corpus
+--          generation (imports/deletes) does not track. collection_generation is
+--          bumped on every such change; together the two numbers form the ETag of
+--          the API's read-only responses (webapp/backend/main.py).
+--
+-- Maintenance:
+--   - Statement triggers on collections, work_collections, section_collections and
+--     verse_collections bump it, covering /admin/collections* endpoints and scripts
+--     such as manage_collections.py / import_collections_by_name.py alike
+
+-- 1. Counter next to corpus_generation
+ALTER TABLE corpus_state ADD COLUMN IF NOT EXISTS collection_generation BIGINT NOT NULL DEFAULT 1;
+
+-- 2. Bump function (returns the new generation)
+CREATE OR REPLACE FUNCTION bump_collection_generation()
+RETURNS BIGINT AS $$
+    UPDATE corpus_state
+    SET collection_generation = collection_generation + 1,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE state_id = 1
+    RETURNING collection_generation;
+$$ LANGUAGE sql;
+
+CREATE OR REPLACE FUNCTION trg_bump_collection_generation()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM bump_collection_generation();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 3. One bump per modifying statement
+DROP TRIGGER IF EXISTS collections_bump_generation ON collections;
+CREATE TRIGGER collections_bump_generation
+AFTER INSERT OR UPDATE OR DELETE ON collections
+FOR EACH STATEMENT EXECUTE FUNCTION trg_bump_collection_generation();
+
+DROP TRIGGER IF EXISTS work_collections_bump_generation ON work_collections;
+CREATE TRIGGER work_collections_bump_generation
+AFTER INSERT OR UPDATE OR DELETE ON work_collections
+FOR EACH STATEMENT EXECUTE FUNCTION trg_bump_collection_generation();
+
+DROP TRIGGER IF EXISTS section_collections_bump_generation ON section_collections;
+CREATE TRIGGER section_collections_bump_generation
+AFTER INSERT OR UPDATE OR DELETE ON section_collections
+FOR EACH STATEMENT EXECUTE FUNCTION trg_bump_collection_generation();
+
+DROP TRIGGER IF EXISTS verse_collections_bump_generation ON verse_collections;
+CREATE TRIGGER verse_collections_bump_generation
+AFTER INSERT OR UPDATE OR DELETE ON verse_collections
+FOR EACH STATEMENT EXECUTE FUNCTION trg_bump_collection_generation();
+
+-- Verify
+SELECT * FROM corpus_state;
@@ -0,0 +1,62 @@
+-- Migration: Per-work word frequency table
+-- Date: 2026-10-16
+-- Purpose: The initial results view only needs the distinct matching words with
+--          their counts, verse counts and per-work breakdown, which search_words
+--          aggregated from every matching row of word_occurrences. word_work_freq
+--          stores one row per (word_text, work) so /search/summary aggregates a
+--          few rows per word instead of every occurrence.
+--
+-- Maintenance:
+--   - scripts/search_index.py refreshes a work's rows after its word_occurrences
+--     (refresh_word_work_freq) and removes them when a work is deleted
+--   - Rows also cascade away with their work
+
+-- 1. Frequency table (one row per distinct word per work)
+CREATE TABLE IF NOT EXISTS word_work_freq (
+    word_text VARCHAR(200) NOT NULL,
+    work_id INTEGER NOT NULL,
+    occurrence_count INTEGER NOT NULL,
+    verse_count INTEGER NOT NULL,  -- Distinct verses of the work containing the word
+    PRIMARY KEY (word_text, work_id),
+    FOREIGN KEY (work_id) REFERENCES works(work_id) ON DELETE CASCADE
+);
+
+-- 2. Indexes (same match forms as word_occurrences; exact match uses the primary key)
+CREATE INDEX IF NOT EXISTS idx_word_work_freq_work ON word_work_freq(work_id);
+CREATE INDEX IF NOT EXISTS idx_word_work_freq_text_pattern
+ON word_work_freq (word_text text_pattern_ops);
+CREATE INDEX IF NOT EXISTS idx_word_work_freq_text_reverse
+ON word_work_freq (reverse(word_text) text_pattern_ops);
+CREATE INDEX IF NOT EXISTS idx_word_work_freq_text_trgm
+ON word_work_freq USING GIN (word_text gin_trgm_ops);
+
+-- 3. Per-work refresh (reads the work's word_occurrences rows)
+CREATE OR REPLACE FUNCTION refresh_word_work_freq(p_work_id INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    inserted_count INTEGER;
+BEGIN
+    DELETE FROM word_work_freq WHERE work_id = p_work_id;
+
+    INSERT INTO word_work_freq (word_text, work_id, occurrence_count, verse_count)
+    SELECT word_text, work_id, COUNT(*), COUNT(DISTINCT verse_id)
+    FROM word_occurrences
+    WHERE work_id = p_work_id
+    GROUP BY word_text, work_id;
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN inserted_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 4. Backfill every work
+SELECT work_id, refresh_word_work_freq(work_id) AS distinct_words
+FROM works
+ORDER BY work_id;
+
+ANALYZE word_work_freq;
+
+-- Verify: frequencies add up to the occurrence count
+SELECT
+    (SELECT COALESCE(SUM(occurrence_count), 0) FROM word_work_freq) AS counted_occurrences,
+    (SELECT COUNT(*) FROM word_occurrences) AS occurrences;
@@ -0,0 +1,33 @@
+-- Migration: Grapheme-cluster keys for match_type=grapheme
+-- Date: 2026-10-16
+-- Purpose: Tamil letters such as கா, கி or க் are one grapheme but several code
+--          points, so a partial search for 'க' also matches every word starting
+--          with கா, கி, கு, க் ... word_graphemes stores each distinct word's
+--          grapheme key (scripts/word_cleaning.py grapheme_key: '|அ|ற|ம்|') so
+--          searches can match whole graphemes at the start, end or anywhere.
+--
+-- Maintenance:
+--   - Keys are computed in Python, so this migration only creates the table; fill it
+--     with: python scripts/search_index.py --graphemes
+--   - scripts/search_index.py adds keys for a work's new words after each import
+--     (refresh_word_graphemes); rebuild_search_index also drops keys of words no
+--     longer in the corpus
+
+-- 1. Vocabulary table (one row per distinct word_text)
+CREATE TABLE IF NOT EXISTS word_graphemes (
+    word_text VARCHAR(200) PRIMARY KEY,
+    grapheme_key VARCHAR(400) NOT NULL  -- Every grapheme enclosed in '|'
+);
+
+-- 2. Indexes (beginning, end and anywhere, as for word_text)
+CREATE INDEX IF NOT EXISTS idx_word_graphemes_key_pattern
+ON word_graphemes (grapheme_key text_pattern_ops);
+CREATE INDEX IF NOT EXISTS idx_word_graphemes_key_reverse
+ON word_graphemes (reverse(grapheme_key) text_pattern_ops);
+CREATE INDEX IF NOT EXISTS idx_word_graphemes_key_trgm
+ON word_graphemes USING GIN (grapheme_key gin_trgm_ops);
+
+-- Verify (after scripts/search_index.py --graphemes): every indexed word has a key
+SELECT
+    (SELECT COUNT(*) FROM word_graphemes) AS keyed_words,
+    (SELECT COUNT(DISTINCT word_text) FROM word_work_freq) AS distinct_words;
@@ -0,0 +1,21 @@
+-- Migration: Tamil alphabetical sort key per word
+-- Date: 2026-10-16
+-- Purpose: unique_words, /roots and autocomplete ordered words with ORDER BY
+--          word_text, i.e. by the database collation (C or en_US on most hosts),
+--          which does not follow the Tamil alphabet (e.g. க் sorts after கௌ).
+--          word_sort_key (scripts/word_cleaning.py tamil_sort_key) is a bytea
+--          whose byte order is Tamil alphabet order under any collation.
+--
+-- Maintenance:
+--   - Keys are computed in Python next to the grapheme keys; fill them with:
+--     python scripts/search_index.py --graphemes
+--   - scripts/search_index.py keys new words on every import (refresh_word_graphemes)
+
+-- 1. Sort key column on the per-word key table (migrations/015)
+ALTER TABLE word_graphemes ADD COLUMN IF NOT EXISTS word_sort_key BYTEA;
+
+-- 2. Index for listings in alphabetical order
+CREATE INDEX IF NOT EXISTS idx_word_graphemes_sort_key ON word_graphemes (word_sort_key);
+
+-- Verify (after scripts/search_index.py --graphemes): no word without a sort key
+SELECT COUNT(*) AS missing_sort_keys FROM word_graphemes WHERE word_sort_key IS NULL;
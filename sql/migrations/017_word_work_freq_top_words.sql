@@ -0,0 +1,52 @@
+-- Migration: Per-work top words and corpus stats from word_work_freq
+-- Date: 2026-10-16
+-- Purpose: sql/Top10InEachWork.sql and /stats grouped every word of the corpus
+--          (GROUP BY word_text per work, COUNT(DISTINCT word_text) over words).
+--          word_work_freq (migrations/014) already holds one row per word per
+--          work; an index on (work_id, occurrence_count DESC) reads a work's most
+--          frequent words in order (/works/{id}/top-words), and distinct_words
+--          is counted from it instead of from words.
+--
+-- Maintenance:
+--   - None beyond migrations/014: scripts/search_index.py refreshes a work's
+--     word_work_freq rows on import and removes them on delete
+
+-- 1. Replace the plain work_id index (the new index leads with work_id too)
+DROP INDEX IF EXISTS idx_word_work_freq_work;
+CREATE INDEX IF NOT EXISTS idx_word_work_freq_work_top
+ON word_work_freq (work_id, occurrence_count DESC, word_text);
+
+-- 2. distinct_words from word_work_freq
+CREATE OR REPLACE FUNCTION refresh_corpus_stats()
+RETURNS VOID AS $$
+    INSERT INTO corpus_stats (
+        state_id, total_works, total_verses, total_lines, total_words,
+        distinct_words, unique_roots, corpus_generation, refreshed_at
+    )
+    SELECT
+        1,
+        (SELECT COUNT(*) FROM works),
+        (SELECT COALESCE(SUM(verse_count), 0) FROM work_stats),
+        (SELECT COALESCE(SUM(line_count), 0) FROM work_stats),
+        (SELECT COALESCE(SUM(word_count), 0) FROM work_stats),
+        (SELECT COUNT(DISTINCT word_text) FROM word_work_freq),
+        (SELECT COUNT(DISTINCT word_root) FROM words WHERE word_root IS NOT NULL),
+        (SELECT corpus_generation FROM corpus_state WHERE state_id = 1),
+        CURRENT_TIMESTAMP
+    ON CONFLICT (state_id) DO UPDATE SET
+        total_works = EXCLUDED.total_works,
+        total_verses = EXCLUDED.total_verses,
+        total_lines = EXCLUDED.total_lines,
+        total_words = EXCLUDED.total_words,
+        distinct_words = EXCLUDED.distinct_words,
+        unique_roots = EXCLUDED.unique_roots,
+        corpus_generation = EXCLUDED.corpus_generation,
+        refreshed_at = EXCLUDED.refreshed_at;
+$$ LANGUAGE sql;
+
+SELECT refresh_corpus_stats();
+
+-- Verify: same number of distinct words as the words table
+SELECT
+    (SELECT distinct_words FROM corpus_stats) AS distinct_words,
+    (SELECT COUNT(DISTINCT word_text) FROM words) AS distinct_words_in_words;
@@ -0,0 +1,76 @@
+-- Migration: Per-word verse posting lists for /search/verses
+-- Date: 2026-10-16
+-- Purpose: "Verses containing அறம் and பொருள் but not இன்பம்" took one /search per
+--          word and an intersection in the browser. verse_postings stores, per word
+--          and work, the sorted positions of the verses containing it;
+--          /search/verses merges these lists (all / any / none) in one pass over
+--          their lengths and pages the result in canonical order.
+--
+-- Maintenance:
+--   - scripts/search_index.py refreshes a work's rows after its word_occurrences
+--     (refresh_verse_postings) and removes them when a work is deleted
+--   - Rows also cascade away with their work
+
+-- 1. Verse order per work: verse_ids[n] is the verse at position n, in the order
+--    of word_occurrences.work_ordinal (section sort order, then verse sort order)
+CREATE TABLE IF NOT EXISTS work_verse_order (
+    work_id INTEGER PRIMARY KEY,
+    verse_ids INTEGER[] NOT NULL,
+    FOREIGN KEY (work_id) REFERENCES works(work_id) ON DELETE CASCADE
+);
+
+-- 2. Posting lists (verse positions ascending, no duplicates)
+CREATE TABLE IF NOT EXISTS verse_postings (
+    word_text VARCHAR(200) NOT NULL,
+    work_id INTEGER NOT NULL,
+    verse_positions INTEGER[] NOT NULL,  -- Positions in work_verse_order.verse_ids
+    PRIMARY KEY (word_text, work_id),
+    FOREIGN KEY (work_id) REFERENCES works(work_id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_verse_postings_work ON verse_postings(work_id);
+
+-- 3. Per-work refresh (reads the work's verses and word_occurrences rows)
+CREATE OR REPLACE FUNCTION refresh_verse_postings(p_work_id INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    inserted_count INTEGER;
+BEGIN
+    DELETE FROM verse_postings WHERE work_id = p_work_id;
+    DELETE FROM work_verse_order WHERE work_id = p_work_id;
+
+    INSERT INTO work_verse_order (work_id, verse_ids)
+    SELECT p_work_id, COALESCE(array_agg(v.verse_id ORDER BY s.sort_order, v.sort_order, v.verse_id), '{}')
+    FROM verses v
+    JOIN sections s ON s.section_id = v.section_id
+    WHERE v.work_id = p_work_id;
+
+    INSERT INTO verse_postings (word_text, work_id, verse_positions)
+    SELECT o.word_text, p_work_id, array_agg(DISTINCT p.verse_position ORDER BY p.verse_position)
+    FROM word_occurrences o
+    JOIN (
+        SELECT u.verse_id, u.verse_position::INTEGER AS verse_position
+        FROM work_verse_order wv
+        CROSS JOIN LATERAL unnest(wv.verse_ids) WITH ORDINALITY AS u(verse_id, verse_position)
+        WHERE wv.work_id = p_work_id
+    ) p ON p.verse_id = o.verse_id
+    WHERE o.work_id = p_work_id
+    GROUP BY o.word_text;
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN inserted_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 4. Backfill every work
+SELECT work_id, refresh_verse_postings(work_id) AS distinct_words
+FROM works
+ORDER BY work_id;
+
+ANALYZE work_verse_order;
+ANALYZE verse_postings;
+
+-- Verify: posting entries equal the distinct (word, verse) pairs
+SELECT
+    (SELECT COALESCE(SUM(cardinality(verse_positions)), 0) FROM verse_postings) AS postings,
+    (SELECT COALESCE(SUM(verse_count), 0) FROM word_work_freq) AS word_verse_pairs;
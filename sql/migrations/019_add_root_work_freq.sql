@@ -0,0 +1,84 @@
+-- Migration: Per-work root frequencies for /stats unique_roots and /roots
+-- Date: 2026-10-16
+-- Purpose: refresh_corpus_stats() still counted unique_roots with
+--          COUNT(DISTINCT word_root) over the whole words table, and /roots
+--          grouped every words row. root_work_freq holds one row per root per
+--          work (like word_work_freq for words), so both read a table the size
+--          of the root vocabulary instead.
+--
+-- Maintenance:
+--   - scripts/search_index.py refreshes a work's rows after its word_occurrences
+--     (refresh_root_work_freq) and removes them when a work is deleted
+--   - Rows also cascade away with their work
+
+-- 1. Per-work root frequencies
+CREATE TABLE IF NOT EXISTS root_work_freq (
+    word_root VARCHAR(200) NOT NULL,
+    work_id INTEGER NOT NULL,
+    occurrence_count INTEGER NOT NULL,
+    PRIMARY KEY (word_root, work_id),
+    FOREIGN KEY (work_id) REFERENCES works(work_id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_root_work_freq_work ON root_work_freq(work_id);
+
+-- 2. Per-work refresh (reads the work's word_occurrences rows)
+CREATE OR REPLACE FUNCTION refresh_root_work_freq(p_work_id INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    inserted_count INTEGER;
+BEGIN
+    DELETE FROM root_work_freq WHERE work_id = p_work_id;
+
+    INSERT INTO root_work_freq (word_root, work_id, occurrence_count)
+    SELECT word_root, work_id, COUNT(*)
+    FROM word_occurrences
+    WHERE work_id = p_work_id AND word_root IS NOT NULL
+    GROUP BY word_root, work_id;
+
+    GET DIAGNOSTICS inserted_count = ROW_COUNT;
+    RETURN inserted_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 3. Backfill every work
+SELECT work_id, refresh_root_work_freq(work_id) AS distinct_roots
+FROM works
+ORDER BY work_id;
+
+ANALYZE root_work_freq;
+
+-- 4. unique_roots from root_work_freq
+CREATE OR REPLACE FUNCTION refresh_corpus_stats()
+RETURNS VOID AS $$
+    INSERT INTO corpus_stats (
+        state_id, total_works, total_verses, total_lines, total_words,
+        distinct_words, unique_roots, corpus_generation, refreshed_at
+    )
+    SELECT
+        1,
+        (SELECT COUNT(*) FROM works),
+        (SELECT COALESCE(SUM(verse_count), 0) FROM work_stats),
+        (SELECT COALESCE(SUM(line_count), 0) FROM work_stats),
+        (SELECT COALESCE(SUM(word_count), 0) FROM work_stats),
+        (SELECT COUNT(DISTINCT word_text) FROM word_work_freq),
+        (SELECT COUNT(DISTINCT word_root) FROM root_work_freq),
+        (SELECT corpus_generation FROM corpus_state WHERE state_id = 1),
+        CURRENT_TIMESTAMP
+    ON CONFLICT (state_id) DO UPDATE SET
+        total_works = EXCLUDED.total_works,
+        total_verses = EXCLUDED.total_verses,
+        total_lines = EXCLUDED.total_lines,
+        total_words = EXCLUDED.total_words,
+        distinct_words = EXCLUDED.distinct_words,
+        unique_roots = EXCLUDED.unique_roots,
+        corpus_generation = EXCLUDED.corpus_generation,
+        refreshed_at = EXCLUDED.refreshed_at;
+$$ LANGUAGE sql;
+
+SELECT refresh_corpus_stats();
+
+-- Verify: same number of roots as the words table
+SELECT
+    (SELECT unique_roots FROM corpus_stats) AS unique_roots,
+    (SELECT COUNT(DISTINCT word_root) FROM words WHERE word_root IS NOT NULL) AS unique_roots_in_words;
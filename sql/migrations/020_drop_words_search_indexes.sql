@@ -0,0 +1,24 @@
+-- Migration: Drop the substring search indexes on words
+-- Date: 2026-10-16
+-- Purpose: 006 added pattern, reversed-text and trigram indexes on words for
+--          word_position=beginning|end|anywhere. Since 007 every search reads
+--          word_occurrences, which has the same three indexes; nothing filters
+--          words.word_text with LIKE, reverse() or trigrams any more, but every
+--          bulk import still paid to maintain them (the GIN index most of all).
+--
+-- Maintenance:
+--   - None: idx_word_occurrences_text_pattern / _reverse / _trgm (007) serve
+--     these searches; pg_trgm stays installed for the trigram index there
+
+DROP INDEX IF EXISTS idx_words_text_trgm;
+DROP INDEX IF EXISTS idx_words_text_reverse;
+DROP INDEX IF EXISTS idx_words_text_pattern;
+
+-- Verify: no rows
+SELECT indexname
+FROM pg_indexes
+WHERE indexname IN (
+    'idx_words_text_trgm',
+    'idx_words_text_reverse',
+    'idx_words_text_pattern'
+);
@@ -0,0 +1,381 @@
+"""
+Async database access for the hot read endpoints (psycopg 3 async pool)
+
+Enabled with DB_DRIVER=async. SQL, cursors and caches are shared with the sync
+Database (database.py); only query execution differs, so both paths return
+identical responses. psycopg 3 is optional - without it the API stays on the
+sync psycopg2 path.
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+from database import (
+    Database, CORPUS_GENERATION_QUERY, GRAPHEME_KEYS_QUERY, VERSE_QUERY, VERSE_LINES_QUERY,
+    VERSE_PAGE_QUERY, COLLECTION_TREE_QUERY, COLLECTION_PARENTS_QUERY, COLLECTION_MEMBERSHIP_QUERY
+)
+
+try:
+    from psycopg.rows import dict_row
+    from psycopg_pool import AsyncConnectionPool
+except ImportError:  # psycopg 3 not installed
+    dict_row = None
+    AsyncConnectionPool = None
+
+logger = logging.getLogger(__name__)
+
+
+def async_driver_available() -> bool:
+    return AsyncConnectionPool is not None
+
+
+class AsyncDatabase:
+    """
+    Async counterpart of Database for /search, /search/summary, /search/verses,
+    /words/{word_text}/occurrences, /verse/{id}, /works and /collections/tree
+
+    Args:
+        db: The sync Database whose query builders and caches are reused
+    """
+
+    def __init__(self, db: Database):
+        if not async_driver_available():
+            raise RuntimeError("DB_DRIVER=async requires psycopg 3: pip install 'psycopg[binary]' psycopg-pool")
+
+        self.db = db
+        self.pool = AsyncConnectionPool(
+            conninfo=db.connection_string,
+            min_size=int(os.getenv("DB_POOL_MIN", "2")),
+            max_size=int(os.getenv("DB_POOL_MAX", "10")),
+            timeout=float(os.getenv("DB_POOL_TIMEOUT", "10")),
+            max_lifetime=float(os.getenv("DB_POOL_MAX_LIFETIME", "1800")),
+            kwargs={"row_factory": dict_row},
+            open=False,
+        )
+
+    async def open(self):
+        """Open the pool (call from the startup event, inside the event loop)"""
+        await self.pool.open()
+        print("✓ Async connection pool created successfully")
+
+    async def close(self):
+        await self.pool.close()
+        print("✓ Async database connections closed")
+
+    async def _fetch(self, conn, query: str, params=None, query_name: str = "query") -> List[Dict]:
+        """Execute a query and return all rows, logging slow queries like the sync path"""
+        start_time = time.time()
+        cur = await conn.execute(query, params)
+        rows = await cur.fetchall()
+        elapsed_ms = (time.time() - start_time) * 1000
+        if elapsed_ms > 100:
+            logger.warning(f"⚠️  Slow query ({elapsed_ms:.2f}ms) - {query_name} [async]: {query[:150]}...")
+        else:
+            logger.info(f"✓ Query completed ({elapsed_ms:.2f}ms) - {query_name} [async]")
+        return rows
+
+    async def get_corpus_generation(self, conn) -> int:
+        generation = self.db._cached_corpus_generation()
+        if generation is not None:
+            return generation
+        rows = await self._fetch(conn, CORPUS_GENERATION_QUERY, query_name="corpus_generation")
+        return self.db._store_corpus_generation(rows[0] if rows else None)
+
+    async def require_grapheme_keys(self, match_type: str):
+        """Async Database._require_grapheme_keys (shares its flag)"""
+        if match_type != "grapheme" or self.db._grapheme_keys_ready:
+            return
+        async with self.pool.connection() as conn:
+            rows = await self._fetch(conn, GRAPHEME_KEYS_QUERY, query_name="grapheme_keys")
+        self.db._store_grapheme_keys_ready(rows[0])
+
+    async def search_words(
+        self,
+        search_term: str,
+        match_type: str = "partial",
+        word_position: str = "beginning",
+        work_ids: Optional[List[int]] = None,
+        word_root: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        sort_by: str = "alphabetical",
+        collection_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        estimate_count: bool = False,
+        include_unique_words: bool = True,
+        compact: bool = False,
+        fields: Optional[List[str]] = None
+    ) -> Dict:
+        """Async Database.search_words (same arguments and response)"""
+        db = self.db
+        await self.require_grapheme_keys(match_type)
+        page = db._build_search_page_query(
+            search_term, match_type, word_position, work_ids, word_root,
+            limit, offset, sort_by, collection_id, cursor,
+            db._validate_search_fields(fields, compact)
+        )
+        filter_where, filter_params = page["filter_where"], page["filter_params"]
+        filter_key = db._search_filter_key(search_term, match_type, word_position, work_ids, word_root)
+
+        request_start = time.perf_counter()
+        timings = {}
+
+        async def timed_fetch(conn, query, params, query_name, phase):
+            phase_start = time.perf_counter()
+            rows = await self._fetch(conn, query, params, query_name)
+            timings[phase] = (time.perf_counter() - phase_start) * 1000
+            return rows
+
+        # unique_words is cached per filter set; the generation for the cache key is
+        # usually cached too, so a miss is known before any connection is taken
+        generation = db._cached_corpus_generation()
+        words_cached = (not include_unique_words or (
+            generation is not None and db.unique_words_cache.get((generation,) + filter_key) is not None
+        ))
+
+        if not words_cached and db.parallel_unique_words:
+            # Page query and unique_words aggregation on two connections at once; the
+            # aggregation's per-word counts also give the exact total_count
+            words_query, words_params = db._build_unique_words_query(filter_where, filter_params, word_root)
+
+            async def run_page():
+                async with self.pool.connection() as conn:
+                    generation = await self.get_corpus_generation(conn)
+                    rows = await timed_fetch(conn, page["query"], page["params"], "main_search", "page")
+                return generation, rows
+
+            async def run_unique_words():
+                async with self.pool.connection() as conn:
+                    return await timed_fetch(conn, words_query, words_params, "unique_words", "unique_words")
+
+            (generation, rows), unique_words = await asyncio.gather(run_page(), run_unique_words())
+            db._store_unique_words(generation, filter_key, unique_words)
+            total_count = sum(word['count'] for word in unique_words)
+            total_count_estimated = False
+        else:
+            async with self.pool.connection() as conn:
+                generation = await self.get_corpus_generation(conn)
+                rows = await timed_fetch(conn, page["query"], page["params"], "main_search", "page")
+
+                unique_words = []
+                if include_unique_words:
+                    unique_words = db.unique_words_cache.get((generation,) + filter_key)
+                    if unique_words is None:
+                        words_query, words_params = db._build_unique_words_query(filter_where, filter_params, word_root)
+                        unique_words = await timed_fetch(conn, words_query, words_params,
+                                                         "unique_words", "unique_words")
+                        db._store_unique_words(generation, filter_key, unique_words)
+
+                count_start = time.perf_counter()
+                total_count, total_count_estimated = await self._count_search_results(
+                    conn, generation, filter_where, filter_params, filter_key, estimate_count
+                )
+                timings["count"] = (time.perf_counter() - count_start) * 1000
+
+        page_fields, next_cursor = db._finish_search_page(
+            rows, page["sort_keys"], limit, sort_by, collection_id, compact
+        )
+        timings["total"] = (time.perf_counter() - request_start) * 1000
+
+        return {
+            **page_fields,
+            "unique_words": unique_words,
+            "total_count": total_count,
+            "total_count_estimated": total_count_estimated,
+            "limit": limit,
+            "offset": page["offset"],
+            "next_cursor": next_cursor,
+            "search_term": search_term,
+            "match_type": match_type,
+            "timings": timings
+        }
+
+    async def _count_search_results(self, conn, generation: int, filter_where: str, filter_params: list,
+                                    filter_key: tuple, allow_estimate: bool) -> tuple:
+        """Async Database._count_search_results (shares its cache)"""
+        db = self.db
+        exact_key = ("exact", generation) + filter_key
+
+        count = db.count_cache.get(exact_key)
+        if count is not None:
+            return count, False
+
+        if allow_estimate:
+            estimate_key = ("estimate", generation) + filter_key
+            estimate = db.count_cache.get(estimate_key)
+            if estimate is None:
+                rows = await self._fetch(
+                    conn, f"EXPLAIN (FORMAT JSON) {db._build_count_query(filter_where)}",
+                    filter_params, "count_estimate"
+                )
+                estimate = db._plan_rows(rows[0])
+                db.count_cache.set(estimate_key, estimate)
+            if estimate >= db.count_estimate_threshold:
+                return estimate, True
+
+        rows = await self._fetch(conn, db._build_count_query(filter_where), filter_params, "count")
+        count = rows[0]['total_count']
+        db.count_cache.set(exact_key, count)
+        return count, False
+
+    async def search_summary(
+        self,
+        search_term: str,
+        match_type: str = "partial",
+        word_position: str = "beginning",
+        work_ids: Optional[List[int]] = None,
+        word_root: Optional[str] = None
+    ) -> Dict:
+        """Async Database.search_summary (same arguments and response)"""
+        db = self.db
+        await self.require_grapheme_keys(match_type)
+        filter_where, filter_params = db._build_search_filters(
+            search_term, match_type, word_position, work_ids, word_root
+        )
+        filter_key = db._search_filter_key(search_term, match_type, word_position, work_ids, word_root)
+
+        async with self.pool.connection() as conn:
+            generation = await self.get_corpus_generation(conn)
+            unique_words = db.unique_words_cache.get((generation,) + filter_key)
+            if unique_words is None:
+                summary_query, summary_params = db._build_unique_words_query(filter_where, filter_params, word_root)
+                unique_words = await self._fetch(conn, summary_query, summary_params, "search_summary")
+                db._store_unique_words(generation, filter_key, unique_words)
+
+        return {
+            "unique_words": unique_words,
+            "total_count": sum(word['count'] for word in unique_words),
+            "search_term": search_term,
+            "match_type": match_type,
+            "word_position": word_position,
+        }
+
+    async def get_word_occurrences(
+        self,
+        word_text: str,
+        work_ids: Optional[List[int]] = None,
+        limit: int = 100,
+        sort_by: str = "alphabetical",
+        collection_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        compact: bool = False,
+        fields: Optional[List[str]] = None
+    ) -> Dict:
+        """Async Database.get_word_occurrences (same arguments and response)"""
+        db = self.db
+        page = db._build_search_page_query(
+            word_text, "exact", "beginning", work_ids, None,
+            limit, 0, sort_by, collection_id, cursor,
+            db._validate_search_fields(fields, compact)
+        )
+        async with self.pool.connection() as conn:
+            rows = await self._fetch(conn, page["query"], page["params"], "word_occurrences")
+        page_fields, next_cursor = db._finish_search_page(
+            rows, page["sort_keys"], limit, sort_by, collection_id, compact
+        )
+
+        return {
+            **page_fields,
+            "word_text": word_text,
+            "limit": limit,
+            "next_cursor": next_cursor,
+        }
+
+    async def search_verses(
+        self,
+        all_words: Optional[List[str]] = None,
+        any_words: Optional[List[str]] = None,
+        none_words: Optional[List[str]] = None,
+        work_ids: Optional[List[int]] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Dict:
+        """Async Database.search_verses (same arguments and response)"""
+        db = self.db
+        all_words, any_words, none_words = all_words or [], any_words or [], none_words or []
+        after = db._decode_verse_cursor(cursor)
+        postings_query, postings_params = db._build_verse_postings_query(
+            all_words, any_words, none_words, work_ids, after[0] if after else None
+        )
+        async with self.pool.connection() as conn:
+            rows = await self._fetch(conn, postings_query, postings_params, "verse_postings")
+            page, total_count, next_cursor = db._verse_match_page(
+                rows, all_words, any_words, none_words, limit, after
+            )
+
+            results = []
+            if page:
+                results = await self._fetch(
+                    conn, VERSE_PAGE_QUERY,
+                    [[work_id for _, work_id, _ in page], [position for _, _, position in page]],
+                    "verse_page"
+                )
+
+        return {
+            "results": results,
+            "total_count": total_count,
+            "limit": limit,
+            "next_cursor": next_cursor,
+        }
+
+    async def get_works(self, sort_by: str = "alphabetical") -> List[Dict]:
+        async def load(conn):
+            return await self._fetch(conn, self.db._build_works_query(sort_by), query_name="works")
+
+        return await self._get_reference(("works", sort_by), load)
+
+    async def get_verse_context(self, verse_id: int) -> Optional[Dict]:
+        async with self.pool.connection() as conn:
+            rows = await self._fetch(conn, VERSE_QUERY, [verse_id], "verse")
+            if not rows:
+                return None
+            verse = dict(rows[0])
+            verse['lines'] = await self._fetch(conn, VERSE_LINES_QUERY, [verse_id], "verse_lines")
+            return verse
+
+    async def get_collection_tree(self, root_collection_id: int = None) -> List[Dict]:
+        async def load(conn):
+            all_collections = await self._fetch(conn, COLLECTION_TREE_QUERY, query_name="collection_tree")
+            return self.db._build_collection_tree(all_collections, root_collection_id)
+
+        return await self._get_reference(("collection_tree", root_collection_id), load)
+
+    async def resolve_collection_scope(self, work_ids: Optional[List[int]], collection_id: Optional[int],
+                                       scope: Optional[str]) -> Optional[List[int]]:
+        """Async Database.resolve_collection_scope (same arguments and result)"""
+        db = self.db
+        if scope is None:
+            return work_ids
+        if collection_id is None:
+            raise ValueError("collection_id is required with scope")
+
+        async def load(conn):
+            parents = await self._fetch(conn, COLLECTION_PARENTS_QUERY, query_name="collection_parents")
+            memberships = await self._fetch(conn, COLLECTION_MEMBERSHIP_QUERY, query_name="collection_membership")
+            return db._build_collection_closure(parents, memberships)
+
+        closure = await self._get_reference(("collection_closure", None), load)
+        return db._scope_work_ids(closure, work_ids, collection_id, scope)
+
+    async def _get_reference(self, key: tuple, load) -> List[Dict]:
+        """Read-through lookup in the shared Database.reference_cache"""
+        db = self.db
+        value = db._peek_reference(key)
+        if value is not None:
+            return value
+
+        async with self.pool.connection() as conn:
+            await self.get_corpus_generation(conn)
+            generations = db._cached_generations()
+            if generations is not None:
+                db._sync_reference_cache(generations)
+            epoch = db._reference_epoch
+            value = await load(conn)
+        db._store_reference(key, value, epoch)
+        return value
+
+    def get_metrics(self) -> Dict:
+        """psycopg_pool statistics (requests_waiting, connections_num, ...)"""
+        return self.pool.get_stats()
@@ -0,0 +1,91 @@
+"""
+In-process caches for the search API
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries also expire after a fixed time-to-live
+
+    Safe to share between the worker threads FastAPI uses for sync endpoints.
+    ttl=None disables expiry (pure LRU).
+    Keys must be hashable; values are returned as stored (callers must not mutate them).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store value under key, evicting the least recently used entry if full"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            expires_at = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key matches predicate; returns how many were dropped"""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self):
+        """Drop every entry (statistics are kept)"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def stats(self) -> Dict:
+        """Hit/miss/eviction counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
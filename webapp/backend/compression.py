@@ -0,0 +1,173 @@
+"""
+Response compression negotiated by Accept-Encoding
+
+Brotli when the brotli package is installed and the client accepts it, otherwise
+gzip. A 500-row /search response repeats the same Tamil strings (line_text,
+hierarchy paths, work names) on every row and compresses to a small fraction of
+its size. brotli is optional - without it only gzip is offered.
+"""
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # brotli not installed: gzip only
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript")
+
+
+def brotli_available() -> bool:
+    return brotli is not None
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Preferred supported content coding for an Accept-Encoding header
+
+    Examples:
+        choose_encoding("gzip, deflate, br") → "br" (brotli installed) / "gzip"
+        choose_encoding("gzip;q=1.0, br;q=0.5") → "gzip"
+        choose_encoding("identity") → None
+    """
+    qualities = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding] = quality
+
+    best, best_quality = None, 0.0
+    for coding in (["br"] if brotli else []) + ["gzip"]:
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:  # Ties keep the earlier (smaller) coding
+            best, best_quality = coding, quality
+    return best
+
+
+class _GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing text/JSON responses of at least minimum_size bytes
+
+    Args:
+        app: The wrapped ASGI app
+        minimum_size: Smaller single-message bodies are sent as-is
+        gzip_level: zlib level 1-9
+        brotli_quality: brotli quality 0-11 (4-6 suit on-the-fly compression)
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 5):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+            if encoding:
+                responder = _CompressionResponder(self, encoding, send)
+                await self.app(scope, receive, responder.send)
+                return
+        await self.app(scope, receive, send)
+
+    def compressor(self, encoding: str):
+        if encoding == "br":
+            return _BrotliCompressor(self.brotli_quality)
+        return _GzipCompressor(self.gzip_level)
+
+
+class _CompressionResponder:
+    """Wraps send() for one response; the start message is held until the first body"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream_send = send
+        self.start_message = None
+        self.compressor = None
+        self.passthrough = False
+
+    async def send(self, message):
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            return
+        if message_type != "http.response.body" or self.passthrough:
+            await self.downstream_send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            headers = MutableHeaders(raw=list(start["headers"]))
+            start["headers"] = headers.raw
+
+            content_type = headers.get("content-type", "")
+            if ("content-encoding" in headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or (not more_body and len(body) < self.middleware.minimum_size)):
+                self.passthrough = True
+                await self.downstream_send(start)
+                await self.downstream_send(message)
+                return
+
+            self.compressor = self.middleware.compressor(self.encoding)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            # The compressed bytes differ from the identity representation; a weak
+            # ETag still matches If-None-Match (see conditional_response in main.py)
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+
+            if not more_body:
+                data = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(data))
+                await self.downstream_send(start)
+                await self.downstream_send({"type": "http.response.body", "body": data})
+                return
+
+            # Streaming response: length unknown until the last chunk
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            await self.downstream_send(start)
+
+        data = self.compressor.compress(body)
+        if not more_body:
+            data += self.compressor.finish()
+        await self.downstream_send({"type": "http.response.body", "body": data, "more_body": more_body})
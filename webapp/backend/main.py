@@ -2,12 +2,19 @@
 FastAPI backend for Tamil Words Search Application
 """
 import os
+from datetime import datetime
+from functools import partial
 from dotenv import load_dotenv
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, List
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Optional, List, Union
 from pydantic import BaseModel
 from database import Database
+from suggest import PrefixIndex, MAX_SUGGESTIONS
+from async_database import AsyncDatabase
+from compression import CompressionMiddleware
 
 # Load environment variables from .env file
 load_dotenv()
@@ -49,13 +56,64 @@ else:
         allow_headers=["*"],
     )
 
+# Compress responses for clients that send Accept-Encoding (brotli if installed, else
+# gzip). Responses smaller than COMPRESSION_MINIMUM_SIZE bytes are sent as-is.
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024")),
+    gzip_level=int(os.getenv("GZIP_LEVEL", "6")),
+    brotli_quality=int(os.getenv("BROTLI_QUALITY", "5")),
+)
+
 # Initialize database with connection pool
 db = Database()
 
+# DB_DRIVER=async serves /search, /verse/{id}, /works and /collections/tree from a
+# psycopg 3 async pool; the default (sync) runs psycopg2 calls on the threadpool
+DB_DRIVER = os.getenv("DB_DRIVER", "sync").lower()
+async_db = AsyncDatabase(db) if DB_DRIVER == "async" else None
+
+# SERVER_TIMING_HEADER=true adds per-phase /search timings (page, unique_words,
+# count, total) as a Server-Timing header, shown in browser dev tools
+SERVER_TIMING_HEADER = os.getenv("SERVER_TIMING_HEADER", "false").lower() == "true"
+
+# /health and /health/ready wait at most this long for a connection and SELECT 1
+HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", "2"))
+
+# HTTP caching of read-only responses (works, collections, verses, stats). Their ETag
+# is built from the corpus and collection generations, which change only on imports,
+# deletes and collection edits, so If-None-Match is answered with 304 from the polled
+# generations without querying the data. s-maxage lets a CDN/nginx reuse responses.
+HTTP_CACHE_CONTROL = os.getenv("HTTP_CACHE_CONTROL", "public, max-age=0, s-maxage=60")
+# Part of every ETag; change it (or bump app.version) when response shapes change
+ETAG_VERSION = os.getenv("ETAG_VERSION", app.version)
+
+# In-memory vocabulary for /suggest, reloaded when the corpus generation changes
+suggest_index = PrefixIndex()
+
+
+@app.on_event("startup")
+def load_suggest_index():
+    """Load the /suggest vocabulary (a failure here is retried on the first /suggest call)"""
+    try:
+        suggest_index.ensure_current(db)
+    except Exception as e:
+        print(f"✗ Suggest index not loaded at startup: {e}")
+
+
+@app.on_event("startup")
+async def open_async_pool():
+    """Open the async pool inside the event loop (DB_DRIVER=async only)"""
+    if async_db:
+        await async_db.open()
+
+
 # Shutdown event to close connection pool gracefully
 @app.on_event("shutdown")
-def shutdown_event():
+async def shutdown_event():
     """Close database connection pool on shutdown"""
+    if async_db:
+        await async_db.close()
     db.close_all_connections()
 
 # Note: Admin user setup is handled lazily on first login attempt
@@ -68,10 +126,54 @@ class SearchResponse(BaseModel):
     results: List[dict]
     unique_words: List[dict]
     total_count: int
+    total_count_estimated: bool = False  # True when total_count is a planner estimate
+    limit: int
+    offset: int
+    next_cursor: Optional[str] = None  # Pass as cursor= to fetch the next page
+    search_term: str
+    match_type: str
+
+
+class CompactSearchResponse(BaseModel):
+    """format=compact: occurrences reference lines, lines verses, verses works (by id)"""
+    format: str
+    occurrences: List[dict]  # word fields + line_id
+    lines: Dict[str, dict]  # line_id -> line_number, line_text, verse_id
+    verses: Dict[str, dict]  # verse_id -> verse fields, hierarchy paths, work_id
+    works: Dict[str, dict]  # work_id -> names, canonical position, chronology
+    unique_words: List[dict]
+    total_count: int
+    total_count_estimated: bool = False
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
+    search_term: str
+    match_type: str
+
+
+class SearchSummaryResponse(BaseModel):
+    unique_words: List[dict]
+    total_count: int
     search_term: str
     match_type: str
+    word_position: str
+
+
+class VerseSearchResponse(BaseModel):
+    results: List[dict]  # Verses with work, hierarchy and lines
+    total_count: int
+    limit: int
+    next_cursor: Optional[str] = None
+
+
+class Suggestion(BaseModel):
+    word_text: str
+    count: int
+
+
+class SuggestResponse(BaseModel):
+    prefix: str
+    suggestions: List[Suggestion]
 
 
 class Work(BaseModel):
@@ -89,6 +191,19 @@ class Work(BaseModel):
     chronology_notes: Optional[str]
 
 
+class WorkWordCount(BaseModel):
+    word_text: str
+    occurrence_count: int
+    verse_count: int
+
+
+class WorkTopWords(BaseModel):
+    work_id: int
+    work_name: str
+    work_name_tamil: str
+    top_words: List[WorkWordCount]
+
+
 class Statistics(BaseModel):
     total_works: int
     total_verses: int
@@ -96,6 +211,7 @@ class Statistics(BaseModel):
     total_words: int
     distinct_words: int
     unique_roots: int
+    refreshed_at: Optional[datetime] = None
 
 
 class CollectionCreate(BaseModel):
@@ -138,38 +254,112 @@ def root():
         "version": "1.0.0",
         "endpoints": {
             "/search": "Search for words",
+            "/search/summary": "Matching words with counts only (no occurrences)",
+            "/search/verses": "Verses containing all/any/none of several words",
+            "/suggest": "Autocomplete words by prefix",
+            "/words/{word_text}/occurrences": "Occurrences of one word (cursor paged)",
             "/works": "Get all works",
+            "/works/{work_id}/top-words": "Most frequent words of a work",
             "/roots": "Get word roots",
             "/verse/{verse_id}": "Get verse details",
-            "/stats": "Get database statistics"
+            "/stats": "Get database statistics",
+            "/health": "Liveness probe",
+            "/health/ready": "Readiness probe"
         }
     }
 
 
-@app.get("/search", response_model=SearchResponse)
-def search_words(
+def conditional_response(request: Request, response: Response) -> Optional[Response]:
+    """
+    Set ETag and Cache-Control for a read-only endpoint's response
+
+    Returns a 304 response when If-None-Match already holds the current ETag (the
+    endpoint returns it as-is), otherwise None and the endpoint builds its body.
+    """
+    corpus_generation, collection_generation = db.get_generations()
+    etag = f'"{ETAG_VERSION}-{corpus_generation}-{collection_generation}"'
+    headers = {"ETag": etag, "Cache-Control": HTTP_CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        if "*" in candidates or etag in candidates or f"W/{etag}" in candidates:
+            return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
+
+
+async def resolve_collection_scope(work_ids: Optional[List[int]], collection_id: Optional[int],
+                                   scope: Optional[str]) -> Optional[List[int]]:
+    """work_ids narrowed to a collection (scope=collection) or its subtree (scope=subtree)"""
+    if scope is None:
+        return work_ids
+    if async_db:
+        return await async_db.resolve_collection_scope(work_ids, collection_id, scope)
+    return await run_in_threadpool(db.resolve_collection_scope, work_ids, collection_id, scope)
+
+
+def fast_json_response(content, response: Response) -> ORJSONResponse:
+    """
+    Serialize content with orjson, skipping response_model validation and jsonable_encoder
+
+    For the large payloads of /search and /verse/{id}, whose shape the Database methods
+    already produce. Headers set on the injected response (ETag, Server-Timing) are kept.
+    """
+    return ORJSONResponse(content, headers=dict(response.headers))
+
+
+def format_server_timing(timings: dict) -> str:
+    """Server-Timing header value from {phase: milliseconds}"""
+    return ", ".join(f"{phase};dur={ms:.1f}" for phase, ms in timings.items())
+
+
+@app.get("/search", response_model=Union[SearchResponse, CompactSearchResponse], response_class=ORJSONResponse)
+async def search_words(
+    response: Response,
     q: str = Query(..., min_length=1, description="Search term (Tamil word)"),
-    match_type: str = Query("partial", pattern="^(exact|partial)$", description="Match type: exact or partial"),
+    match_type: str = Query("partial", pattern="^(exact|partial|grapheme)$", description="Match type: exact, partial or grapheme"),
     word_position: str = Query("beginning", pattern="^(beginning|end|anywhere)$", description="Word position: beginning, end, or anywhere"),
     work_ids: Optional[str] = Query(None, description="Comma-separated work IDs to filter"),
     word_root: Optional[str] = Query(None, description="Filter by word root"),
     limit: int = Query(100, ge=0, le=500, description="Maximum results per page"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
+    offset: int = Query(0, ge=0, description="Pagination offset (deprecated: use cursor)"),
     sort_by: str = Query("alphabetical", pattern="^(alphabetical|canonical|chronological|collection)$", description="Sort order: alphabetical, canonical (traditional order 1-22), chronological, or collection"),
-    collection_id: Optional[int] = Query(None, description="Collection ID for collection-based sorting (required when sort_by=collection)")
+    collection_id: Optional[int] = Query(None, description="Collection ID for collection-based sorting (required when sort_by=collection) or for scope"),
+    scope: Optional[str] = Query(None, pattern="^(collection|subtree)$", description="Only search the works of collection_id (collection) or of it and its sub-collections (subtree)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (keyset pagination)"),
+    estimate_count: bool = Query(False, description="Allow an estimated total_count for very broad searches"),
+    include_unique_words: bool = Query(True, description="Set false on paging calls to skip the unique_words aggregation"),
+    format: str = Query("full", pattern="^(full|compact)$", description="full: one row per occurrence; compact: occurrences plus line/verse/work lookup tables"),
+    fields: Optional[str] = Query(None, description="Comma-separated result fields to return (default: all)")
 ):
     """
     Search for Tamil words across all literary works
 
     - **q**: Tamil word to search for (required)
-    - **match_type**: "exact" for exact match, "partial" for substring match
+    - **match_type**: "exact" for exact match, "partial" for substring match, "grapheme" for a match on whole Tamil letters ("க" finds கடல் but not கால் or க்)
     - **word_position**: "beginning" for words starting with search term, "end" for words ending with it, "anywhere" for substring match
     - **work_ids**: Filter by specific works (comma-separated IDs)
     - **word_root**: Filter by word root
     - **limit**: Maximum number of results (1-500)
-    - **offset**: Pagination offset
+    - **offset**: Pagination offset (kept for backward compatibility; ignored when cursor is given)
     - **sort_by**: Sort order - "alphabetical" (default), "canonical" (traditional 1-22 order), "chronological", or "collection"
     - **collection_id**: Collection ID for custom ordering (required when sort_by="collection")
+    - **scope**: With collection_id, restrict the search to the collection's works ("collection")
+      or to the works of the collection and all its sub-collections ("subtree");
+      combined with work_ids, both filters apply
+    - **cursor**: Opaque next_cursor from the previous response; returns the rows after it.
+      Deep pages cost the same as the first page, unlike offset.
+    - **estimate_count**: Return a planner estimate as total_count for very broad searches
+      (total_count_estimated=true) instead of counting every match
+    - **include_unique_words**: Set false when paging; unique_words is then returned empty
+    - **format**: "full" (default) returns `results` rows with every field; "compact" returns
+      `occurrences` (word fields + line_id) and `lines`, `verses`, `works` tables keyed by id,
+      so fields shared by many occurrences are sent once
+    - **fields**: Comma-separated result fields, e.g. `word_text,line_text,work_name_tamil`;
+      only those columns are selected (unknown fields are a 400). format=compact always
+      adds line_id, verse_id and work_id.
     """
     try:
         # Parse work_ids if provided
@@ -177,12 +367,19 @@ def search_words(
         if work_ids:
             work_id_list = [int(x.strip()) for x in work_ids.split(",")]
 
+        field_list = None
+        if fields:
+            field_list = [field.strip() for field in fields.split(",") if field.strip()]
+
         # Validate collection_id requirement
         if sort_by == "collection" and collection_id is None:
             raise HTTPException(status_code=400, detail="collection_id is required when sort_by=collection")
 
+        work_id_list = await resolve_collection_scope(work_id_list, collection_id, scope)
+
         # Search database
-        results = db.search_words(
+        run_search = async_db.search_words if async_db else partial(run_in_threadpool, db.search_words)
+        results = await run_search(
             search_term=q,
             match_type=match_type,
             word_position=word_position,
@@ -191,11 +388,24 @@ def search_words(
             limit=limit,
             offset=offset,
             sort_by=sort_by,
-            collection_id=collection_id
+            collection_id=collection_id,
+            cursor=cursor,
+            estimate_count=estimate_count,
+            include_unique_words=include_unique_words,
+            compact=format == "compact",
+            fields=field_list
         )
 
-        return results
+        timings = results.pop("timings", {})
+        if SERVER_TIMING_HEADER:
+            response.headers["Server-Timing"] = format_server_timing(timings)
+
+        return fast_json_response(results, response)
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         import traceback
         import sys
@@ -215,8 +425,182 @@ def search_words(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/search/summary", response_model=SearchSummaryResponse, response_class=ORJSONResponse)
+async def search_summary(
+    q: str = Query(..., min_length=1, description="Search term (Tamil word)"),
+    match_type: str = Query("partial", pattern="^(exact|partial|grapheme)$", description="Match type: exact, partial or grapheme"),
+    word_position: str = Query("beginning", pattern="^(beginning|end|anywhere)$", description="Word position: beginning, end, or anywhere"),
+    work_ids: Optional[str] = Query(None, description="Comma-separated work IDs to filter"),
+    word_root: Optional[str] = Query(None, description="Filter by word root"),
+    collection_id: Optional[int] = Query(None, description="Collection for scope"),
+    scope: Optional[str] = Query(None, pattern="^(collection|subtree)$", description="Only the works of collection_id (collection) or of its subtree (subtree)")
+):
+    """
+    Distinct words matching a search, with counts, verse counts and per-work breakdown
+
+    The initial results view: same filters and unique_words as /search, but no
+    occurrences are read (served from the per-work word frequency table).
+    total_count is the number of matching occurrences.
+    """
+    try:
+        work_id_list = None
+        if work_ids:
+            work_id_list = [int(x.strip()) for x in work_ids.split(",")]
+        work_id_list = await resolve_collection_scope(work_id_list, collection_id, scope)
+
+        run_summary = async_db.search_summary if async_db else partial(run_in_threadpool, db.search_summary)
+        summary = await run_summary(
+            search_term=q,
+            match_type=match_type,
+            word_position=word_position,
+            work_ids=work_id_list,
+            word_root=word_root
+        )
+        return ORJSONResponse(summary)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def split_words(words: Optional[str]) -> List[str]:
+    """Comma-separated words as a list without blanks or repeats"""
+    if not words:
+        return []
+    return list(dict.fromkeys(word.strip() for word in words.split(",") if word.strip()))
+
+
+@app.get("/search/verses", response_model=VerseSearchResponse, response_class=ORJSONResponse)
+async def search_verses(
+    all_words: Optional[str] = Query(None, alias="all", description="Comma-separated words every verse must contain"),
+    any_words: Optional[str] = Query(None, alias="any", description="Comma-separated words of which a verse must contain at least one"),
+    none_words: Optional[str] = Query(None, alias="none", description="Comma-separated words a verse must not contain"),
+    work_ids: Optional[str] = Query(None, description="Comma-separated work IDs to filter"),
+    collection_id: Optional[int] = Query(None, description="Collection for scope"),
+    scope: Optional[str] = Query(None, pattern="^(collection|subtree)$", description="Only the works of collection_id (collection) or of its subtree (subtree)"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum verses per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
+):
+    """
+    Verses matching a boolean combination of exact words, in canonical order
+
+    - **all**: Words every verse must contain (e.g. அறம்,பொருள்)
+    - **any**: Words of which a verse must contain at least one
+    - **none**: Words a verse must not contain (e.g. இன்பம்)
+    - **limit** / **cursor**: Page size and next_cursor of the previous page
+
+    all or any is required. Answered from per-word verse posting lists.
+    """
+    try:
+        work_id_list = None
+        if work_ids:
+            work_id_list = [int(x.strip()) for x in work_ids.split(",")]
+        work_id_list = await resolve_collection_scope(work_id_list, collection_id, scope)
+
+        run_search = async_db.search_verses if async_db else partial(run_in_threadpool, db.search_verses)
+        verses = await run_search(
+            all_words=split_words(all_words),
+            any_words=split_words(any_words),
+            none_words=split_words(none_words),
+            work_ids=work_id_list,
+            limit=limit,
+            cursor=cursor
+        )
+        return ORJSONResponse(verses)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/words/{word_text}/occurrences", response_class=ORJSONResponse)
+async def get_word_occurrences(
+    word_text: str,
+    work_ids: Optional[str] = Query(None, description="Comma-separated work IDs to filter"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum occurrences per page"),
+    sort_by: str = Query("alphabetical", pattern="^(alphabetical|canonical|chronological|collection)$", description="Sort order (as /search)"),
+    collection_id: Optional[int] = Query(None, description="Collection ID (required when sort_by=collection) or for scope"),
+    scope: Optional[str] = Query(None, pattern="^(collection|subtree)$", description="Only the works of collection_id (collection) or of its subtree (subtree)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    format: str = Query("full", pattern="^(full|compact)$", description="full or compact (as /search)"),
+    fields: Optional[str] = Query(None, description="Comma-separated result fields to return (default: all)")
+):
+    """
+    Occurrences of one word, for expanding a word from the /search results
+
+    Reads only that word's rows in sort order (one index range scan per page); no
+    unique_words or total_count is computed - the /search response already has them.
+
+    - **word_text**: The exact word
+    - **work_ids**, **sort_by**, **collection_id**, **scope**, **format**, **fields**: As for /search
+    - **cursor**: Opaque next_cursor from the previous page (also accepts the
+      next_cursor of an exact /search for the same word and sort order)
+    """
+    try:
+        work_id_list = None
+        if work_ids:
+            work_id_list = [int(x.strip()) for x in work_ids.split(",")]
+
+        field_list = None
+        if fields:
+            field_list = [field.strip() for field in fields.split(",") if field.strip()]
+
+        if sort_by == "collection" and collection_id is None:
+            raise HTTPException(status_code=400, detail="collection_id is required when sort_by=collection")
+
+        work_id_list = await resolve_collection_scope(work_id_list, collection_id, scope)
+
+        run_query = async_db.get_word_occurrences if async_db else partial(run_in_threadpool, db.get_word_occurrences)
+        occurrences = await run_query(
+            word_text=word_text,
+            work_ids=work_id_list,
+            limit=limit,
+            sort_by=sort_by,
+            collection_id=collection_id,
+            cursor=cursor,
+            compact=format == "compact",
+            fields=field_list
+        )
+        return ORJSONResponse(occurrences)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/suggest", response_model=SuggestResponse)
+def suggest_words(
+    prefix: str = Query(..., min_length=1, description="Leading characters of the word (Tamil)"),
+    limit: int = Query(10, ge=1, le=MAX_SUGGESTIONS, description="Maximum suggestions"),
+    order: str = Query("frequency", pattern="^(frequency|alphabetical)$", description="Order: frequency (most used first) or alphabetical")
+):
+    """
+    Autocomplete: distinct words starting with a prefix, with occurrence counts
+
+    Served from an in-memory sorted vocabulary (no query per keystroke); the
+    vocabulary is reloaded when the corpus changes.
+
+    - **prefix**: Leading characters of the word (required)
+    - **limit**: Maximum number of suggestions (1-50)
+    - **order**: "frequency" (default) or "alphabetical"
+    """
+    try:
+        suggest_index.ensure_current(db)
+        prefix = prefix.strip()
+        return {
+            "prefix": prefix,
+            "suggestions": suggest_index.suggest(prefix, limit, order)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/works", response_model=List[Work])
-def get_works(
+async def get_works(
+    request: Request,
+    response: Response,
     sort_by: str = Query("alphabetical", pattern="^(alphabetical|canonical|chronological)$",
                         description="Sort order: alphabetical (by name), canonical (traditional 1-22 order), or chronological (by date)")
 ):
@@ -228,7 +612,39 @@ def get_works(
     - **sort_by**: Sort order - "alphabetical", "canonical" (traditional 1-22 order), or "chronological"
     """
     try:
-        return db.get_works(sort_by=sort_by)
+        not_modified = await run_in_threadpool(conditional_response, request, response)
+        if not_modified:
+            return not_modified
+        if async_db:
+            return await async_db.get_works(sort_by=sort_by)
+        return await run_in_threadpool(db.get_works, sort_by=sort_by)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/works/{work_id}/top-words", response_model=WorkTopWords)
+def get_work_top_words(
+    work_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(10, ge=1, le=100, description="Number of words")
+):
+    """
+    Most frequent words of a work
+
+    - **work_id**: ID of the work
+    - **limit**: Number of words (1-100), most frequent first
+    """
+    try:
+        not_modified = conditional_response(request, response)
+        if not_modified:
+            return not_modified
+        top_words = db.get_work_top_words(work_id, limit)
+        if top_words is None:
+            raise HTTPException(status_code=404, detail="Work not found")
+        return top_words
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -248,18 +664,24 @@ def get_word_roots(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/verse/{verse_id}")
-def get_verse(verse_id: int):
+@app.get("/verse/{verse_id}", response_class=ORJSONResponse)
+async def get_verse(verse_id: int, request: Request, response: Response):
     """
     Get complete verse with all lines and context
 
     - **verse_id**: ID of the verse to retrieve
     """
     try:
-        verse = db.get_verse_context(verse_id)
+        not_modified = await run_in_threadpool(conditional_response, request, response)
+        if not_modified:
+            return not_modified
+        if async_db:
+            verse = await async_db.get_verse_context(verse_id)
+        else:
+            verse = await run_in_threadpool(db.get_verse_context, verse_id)
         if not verse:
             raise HTTPException(status_code=404, detail="Verse not found")
-        return verse
+        return fast_json_response(verse, response)
     except HTTPException:
         raise
     except Exception as e:
@@ -281,26 +703,38 @@ def test_verse_type():
 
 
 @app.get("/stats", response_model=Statistics)
-def get_statistics():
+def get_statistics(request: Request, response: Response):
     """
     Get database statistics
 
-    Returns counts of works, verses, lines, words, and unique roots
+    Returns counts of works, verses, lines, words, and unique roots from the
+    snapshot refreshed on import (refreshed_at says when)
     """
     try:
-        return db.get_statistics()
+        not_modified = conditional_response(request, response)
+        if not_modified:
+            return not_modified
+        stats = db.get_statistics()
+        if stats['corpus_generation'] < db.get_generations()[0]:
+            # Out-of-date snapshot (being refreshed): don't let it be cached under the current ETag
+            del response.headers["ETag"]
+            response.headers["Cache-Control"] = "no-store"
+        return stats
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/collections")
-def get_public_collections():
+def get_public_collections(request: Request, response: Response):
     """
     Get all collections (public endpoint for sort options)
 
     Returns list of collections for use in sorting options
     """
     try:
+        not_modified = conditional_response(request, response)
+        if not_modified:
+            return not_modified
         return db.get_collections(include_works=False)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -318,7 +752,11 @@ def get_designated_filter_collection():
 
 
 @app.get("/collections/tree")
-def get_collections_tree(root: int = Query(None, description="Root collection ID to filter tree")):
+async def get_collections_tree(
+    request: Request,
+    response: Response,
+    root: int = Query(None, description="Root collection ID to filter tree")
+):
     """
     Get collections as a nested tree structure for filter navigation
 
@@ -328,13 +766,18 @@ def get_collections_tree(root: int = Query(None, description="Root collection ID
     Returns hierarchical collection tree with work counts
     """
     try:
-        return db.get_collection_tree(root_collection_id=root)
+        not_modified = await run_in_threadpool(conditional_response, request, response)
+        if not_modified:
+            return not_modified
+        if async_db:
+            return await async_db.get_collection_tree(root_collection_id=root)
+        return await run_in_threadpool(db.get_collection_tree, root_collection_id=root)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/collections/{collection_id}/works")
-def get_collection_works(collection_id: int):
+def get_collection_works(collection_id: int, request: Request, response: Response):
     """
     Get all works in a specific collection
 
@@ -344,23 +787,31 @@ def get_collection_works(collection_id: int):
     Returns list of works in the collection
     """
     try:
+        not_modified = conditional_response(request, response)
+        if not_modified:
+            return not_modified
         return db.get_works_by_collection(collection_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# Health check endpoint
+# Health check endpoints
 @app.get("/health")
-def health_check():
-    """Health check endpoint"""
+def health_check(response: Response):
+    """
+    Liveness probe: one pooled SELECT 1 with a short timeout
+
+    Returns 503 if no connection or answer arrives within HEALTH_CHECK_TIMEOUT seconds.
+    """
     try:
-        stats = db.get_statistics()
+        latency_ms = db.ping(timeout=HEALTH_CHECK_TIMEOUT)
         return {
             "status": "healthy",
             "database": "connected",
-            "stats": stats
+            "latency_ms": round(latency_ms, 2)
         }
     except Exception as e:
+        response.status_code = 503
         return {
             "status": "unhealthy",
             "database": "disconnected",
@@ -368,6 +819,47 @@ def health_check():
         }
 
 
+@app.get("/health/ready")
+def readiness_check(response: Response):
+    """
+    Readiness probe: database reachable and the connection pool not saturated
+
+    Not ready (503) when the ping fails or at least as many requests are waiting
+    for a connection as the pool holds.
+    """
+    pool = db.connection_pool.stats()
+    try:
+        latency_ms = db.ping(timeout=HEALTH_CHECK_TIMEOUT)
+        database = {"status": "connected", "latency_ms": round(latency_ms, 2)}
+    except Exception as e:
+        database = {"status": "disconnected", "error": str(e)}
+
+    ready = database["status"] == "connected" and pool["waiting"] < pool["maxconn"]
+    if not ready:
+        response.status_code = 503
+
+    readiness = {
+        "status": "ready" if ready else "not_ready",
+        "database": database,
+        "pool": pool,
+        "suggest_index_loaded": suggest_index.generation is not None,
+    }
+    if async_db:
+        readiness["async_pool"] = async_db.get_metrics()
+    return readiness
+
+
+@app.get("/debug/metrics")
+def debug_metrics():
+    """Connection pool occupancy/wait times, cache hit rates and suggest index status"""
+    metrics = db.get_metrics()
+    metrics["db_driver"] = DB_DRIVER
+    if async_db:
+        metrics["async_pool"] = async_db.get_metrics()
+    metrics["suggest_index"] = suggest_index.stats()
+    return metrics
+
+
 @app.get("/debug/sample-words")
 def debug_sample_words():
     """Debug endpoint - get sample words from database"""
@@ -431,6 +923,19 @@ def admin_login(credentials: LoginRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/admin/stats", response_model=Statistics)
+def get_admin_statistics(
+    fresh: bool = Query(False, description="Recompute the statistics snapshot now")
+):
+    """
+    Database statistics; fresh=true recounts the corpus and stores a new snapshot
+    """
+    try:
+        return db.get_statistics(fresh=fresh)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # =========================================================================
 # Admin Collection Endpoints
 # =========================================================================
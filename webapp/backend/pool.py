@@ -0,0 +1,234 @@
+"""
+Thread-safe PostgreSQL connection pool for the search API
+
+psycopg2's SimpleConnectionPool is not thread-safe and raises PoolError as soon
+as every connection is checked out. FastAPI runs sync endpoints on a threadpool
+(up to 40 workers), so requests need to queue for a connection instead.
+"""
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import psycopg2
+from psycopg2 import extensions
+from psycopg2.pool import PoolError
+
+
+class PoolTimeout(PoolError):
+    """No connection became available within the checkout timeout"""
+
+
+class BoundedConnectionPool:
+    """
+    Bounded, thread-safe connection pool with a waiting queue
+
+    - getconn() waits (up to timeout seconds) for a free connection instead of
+      failing when all maxconn connections are in use
+    - Connections idle for longer than validate_after seconds are checked with
+      SELECT 1 before being handed out; broken ones are replaced
+    - Connections older than max_lifetime seconds are closed and recreated
+    - stats() reports in-use/idle counts, wait times, timeouts and recycling
+
+    Same getconn/putconn/closeall interface as psycopg2.pool.SimpleConnectionPool.
+    """
+
+    def __init__(self, minconn: int, maxconn: int, dsn: str, timeout: float = 10.0,
+                 max_lifetime: float = 1800.0, validate_after: float = 30.0):
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise ValueError("Pool requires 0 <= minconn <= maxconn and maxconn >= 1")
+
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.dsn = dsn
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.validate_after = validate_after
+
+        self._cond = threading.Condition(threading.Lock())
+        self._idle = deque()  # (conn, created_at, returned_at) - most recently returned last
+        self._in_use: Dict[int, float] = {}  # id(conn) -> created_at
+        self._size = 0  # Open connections plus connections being opened
+        self._waiting = 0
+        self.closed = False
+
+        # Metrics
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_ms_total = 0.0
+        self._wait_ms_max = 0.0
+        self._timeouts = 0
+        self._created = 0
+        self._recycled = 0
+        self._validation_failures = 0
+
+        for _ in range(minconn):
+            conn = self._connect()
+            now = time.monotonic()
+            self._idle.append((conn, now, now))
+            self._size += 1
+            self._created += 1
+
+    def _connect(self):
+        return psycopg2.connect(self.dsn)
+
+    def _close_quietly(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_usable(self, conn, returned_at: float) -> bool:
+        """Cheap check first; SELECT 1 only for connections idle a while"""
+        if conn.closed:
+            return False
+        if time.monotonic() - returned_at < self.validate_after:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def getconn(self, timeout: Optional[float] = None, wait: bool = True):
+        """
+        Check out a connection, waiting up to timeout seconds if all are in use
+
+        With wait=False, returns None instead of waiting when none is free (for
+        optional extra connections, e.g. a second query run in parallel).
+
+        Raises:
+            PoolTimeout: If no connection became available in time
+            PoolError: If the pool is closed
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        waited = False
+
+        while True:
+            with self._cond:
+                if self.closed:
+                    raise PoolError("connection pool is closed")
+
+                while not self._idle and self._size >= self.maxconn:
+                    if not wait:
+                        return None
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeout(
+                            f"no connection available within {timeout:.1f}s "
+                            f"({self.maxconn} in use, {self._waiting} waiting)"
+                        )
+                    waited = True
+                    self._waiting += 1
+                    try:
+                        self._cond.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+                    if self.closed:
+                        raise PoolError("connection pool is closed")
+
+                if self._idle:
+                    conn, created_at, returned_at = self._idle.pop()
+                else:
+                    # Reserve a slot, then connect outside the lock
+                    conn, created_at, returned_at = None, None, None
+                    self._size += 1
+
+            if conn is None:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                created_at = time.monotonic()
+                with self._cond:
+                    self._created += 1
+            else:
+                expired = time.monotonic() - created_at > self.max_lifetime
+                if expired or not self._is_usable(conn, returned_at):
+                    self._close_quietly(conn)
+                    with self._cond:
+                        self._size -= 1
+                        if expired:
+                            self._recycled += 1
+                        else:
+                            self._validation_failures += 1
+                    continue  # Take another idle connection or open a new one
+
+            wait_ms = (time.monotonic() - start) * 1000
+            with self._cond:
+                self._in_use[id(conn)] = created_at
+                self._checkouts += 1
+                if waited:
+                    self._waits += 1
+                    self._wait_ms_total += wait_ms
+                    self._wait_ms_max = max(self._wait_ms_max, wait_ms)
+            return conn
+
+    def putconn(self, conn, close: bool = False):
+        """Return a connection to the pool (rolled back if left in a transaction)"""
+        with self._cond:
+            created_at = self._in_use.pop(id(conn), None)
+        if created_at is None:
+            raise PoolError("trying to put unkeyed connection")
+
+        if not close and not conn.closed:
+            try:
+                if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception:
+                close = True
+
+        if not close and time.monotonic() - created_at > self.max_lifetime:
+            close = True
+            with self._cond:
+                self._recycled += 1
+
+        if close or conn.closed or self.closed:
+            self._close_quietly(conn)
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            return
+
+        with self._cond:
+            self._idle.append((conn, created_at, time.monotonic()))
+            self._cond.notify()
+
+    def closeall(self):
+        """Close idle connections and reject further checkouts"""
+        with self._cond:
+            self.closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn, _, _ in idle:
+            self._close_quietly(conn)
+
+    def stats(self) -> Dict:
+        """Snapshot of pool occupancy and wait metrics"""
+        with self._cond:
+            return {
+                "maxconn": self.maxconn,
+                "minconn": self.minconn,
+                "open": self._size,
+                "in_use": len(self._in_use),
+                "idle": len(self._idle),
+                "waiting": self._waiting,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "wait_ms_avg": round(self._wait_ms_total / self._waits, 2) if self._waits else 0.0,
+                "wait_ms_max": round(self._wait_ms_max, 2),
+                "timeouts": self._timeouts,
+                "created": self._created,
+                "recycled": self._recycled,
+                "validation_failures": self._validation_failures,
+            }
@@ -0,0 +1,78 @@
+"""
+Sorted posting-list operations for /search/verses
+
+Lists are ascending integers without duplicates (verse_postings.verse_positions).
+Every operation is a single merge pass, linear in the lengths of its inputs.
+"""
+import heapq
+from typing import List, Sequence
+
+
+def intersect(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    """Values in both a and b"""
+    result = []
+    i, j = 0, 0
+    len_a, len_b = len(a), len(b)
+    while i < len_a and j < len_b:
+        x, y = a[i], b[j]
+        if x == y:
+            result.append(x)
+            i += 1
+            j += 1
+        elif x < y:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def union(lists: Sequence[Sequence[int]]) -> List[int]:
+    """Values in any of lists"""
+    if len(lists) == 1:
+        return list(lists[0])
+    result = []
+    for value in heapq.merge(*lists):
+        if not result or result[-1] != value:
+            result.append(value)
+    return result
+
+
+def difference(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    """Values of a not in b"""
+    result = []
+    j, len_b = 0, len(b)
+    for x in a:
+        while j < len_b and b[j] < x:
+            j += 1
+        if j == len_b or b[j] != x:
+            result.append(x)
+    return result
+
+
+def match(all_lists: Sequence[Sequence[int]], any_lists: Sequence[Sequence[int]],
+          none_lists: Sequence[Sequence[int]]) -> List[int]:
+    """
+    Values in every all_lists list, in at least one any_lists list (if any are
+    given) and in no none_lists list
+
+    A word without postings is an empty list (in all_lists it matches nothing).
+    With all_lists and any_lists both empty nothing matches.
+
+    Examples:
+        match([[1, 4, 7], [4, 7, 9]], [], [[7]]) → [4]
+        match([], [[2], [1, 2, 5]], []) → [1, 2, 5]
+    """
+    result = None
+    # Shortest list first, so every intermediate result is at most that long
+    for postings in sorted(all_lists, key=len):
+        result = list(postings) if result is None else intersect(result, postings)
+        if not result:
+            return []
+
+    if any_lists:
+        matches = union(any_lists)
+        result = matches if result is None else intersect(result, matches)
+
+    if none_lists and result:
+        result = difference(result, union(none_lists))
+    return result or []
@@ -0,0 +1,182 @@
+"""
+In-memory prefix index of the corpus vocabulary for /suggest (autocomplete)
+"""
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+from cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Sorts after every Tamil/Latin code point, so prefix + PREFIX_END bounds a prefix range
+PREFIX_END = "\U0010ffff"
+
+# Upper bound for limit; memoized lists hold this many and are sliced per request
+MAX_SUGGESTIONS = 50
+
+# Prefixes up to this many characters are ranked at load time - they have the
+# widest ranges (a single letter can match tens of thousands of words)
+PRECOMPUTED_PREFIX_LENGTH = 2
+
+
+class PrefixIndex:
+    """
+    Sorted array of distinct word_text values with their occurrence counts
+
+    A prefix lookup is two bisects into the sorted words; the matching range is
+    then ranked by frequency or by Tamil alphabet order (word_graphemes.word_sort_key,
+    see migrations/016). Results for each
+    (prefix, order) are memoized until the next reload, and the widest ranges
+    (1-2 character prefixes) are ranked once at load time.
+
+    The index is rebuilt in the background when the corpus generation changes (see
+    ensure_current). Readers never block on a reload: they keep the previous
+    arrays until the new ones are swapped in atomically.
+    """
+
+    def __init__(self, memo_size: int = 8192):
+        self.memo_size = memo_size
+        # (sorted words, counts, alphabet ranks, memo) - replaced as a whole on reload
+        self._snapshot = ([], [], [], TTLCache(maxsize=memo_size, ttl=None))
+        self._reload_lock = threading.Lock()
+        self.generation: Optional[int] = None
+        self.loaded_at: Optional[float] = None
+        self.load_ms: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self._snapshot[0])
+
+    def load(self, db, generation: Optional[int] = None):
+        """
+        Load the vocabulary (word_text, count, sort key)
+
+        Counts are summed from word_work_freq (migrations/014, a few rows per word)
+        rather than grouping every word_occurrences row.
+        """
+        start = time.perf_counter()
+        with db.get_connection() as conn:
+            with conn.cursor() as cur:
+                if generation is None:
+                    generation = db.get_corpus_generation(cur)
+                cur.execute("""
+                    SELECT f.word_text, f.count, g.word_sort_key
+                    FROM (
+                        SELECT word_text, SUM(occurrence_count) AS count
+                        FROM word_work_freq
+                        GROUP BY word_text
+                    ) f
+                    LEFT JOIN word_graphemes g ON g.word_text = f.word_text
+                """)
+                rows = cur.fetchall()
+
+        # Python string order (code points), matching the bisect comparisons below
+        rows.sort(key=lambda row: row[0])
+        words = [row[0] for row in rows]
+        counts = [row[1] for row in rows]
+
+        # Position of each word in Tamil alphabet order (words without a key last)
+        alphabet_order = sorted(
+            range(len(rows)),
+            key=lambda i: (rows[i][2] is None, bytes(rows[i][2] or b""), words[i])
+        )
+        alphabet_ranks = [0] * len(rows)
+        for rank, i in enumerate(alphabet_order):
+            alphabet_ranks[i] = rank
+
+        memo = TTLCache(maxsize=self.memo_size, ttl=None)
+        short_prefixes = {word[:length] for word in words
+                          for length in range(1, PRECOMPUTED_PREFIX_LENGTH + 1)}
+        for prefix in short_prefixes:
+            memo.set((prefix, "frequency"), self._rank(words, counts, alphabet_ranks, prefix, "frequency"))
+
+        # Swap in one assignment so concurrent lookups see a consistent snapshot
+        self._snapshot = (words, counts, alphabet_ranks, memo)
+        self.generation = generation
+        self.loaded_at = time.time()
+        self.load_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"✓ Suggest index loaded: {len(words)} words in {self.load_ms:.0f}ms "
+                    f"(generation {generation})")
+
+    def ensure_current(self, db):
+        """
+        Reload if the corpus generation changed since the last load
+
+        The first load runs on the calling thread (there is nothing to serve yet).
+        Later reloads run on db.search_executor and the caller gets the previous
+        index, so no request waits for a reload.
+        """
+        generation = db.get_corpus_generation()
+        if generation == self.generation:
+            return
+
+        if self.generation is None:
+            with self._reload_lock:
+                if self.generation is None:
+                    self.load(db, generation)
+            return
+
+        # Only one reload at a time; the index keeps serving the previous snapshot
+        if not self._reload_lock.acquire(blocking=False):
+            return
+        try:
+            db.search_executor.submit(self._reload_locked, db, generation)
+        except RuntimeError:  # Executor shut down
+            self._reload_lock.release()
+
+    def _reload_locked(self, db, generation: int):
+        """Worker for ensure_current; always releases _reload_lock"""
+        try:
+            if generation != self.generation:
+                self.load(db, generation)
+        except Exception as e:
+            logger.warning(f"Suggest index reload failed: {e}")
+        finally:
+            self._reload_lock.release()
+
+    def suggest(self, prefix: str, limit: int = 10, order: str = "frequency") -> List[Dict]:
+        """
+        Words starting with prefix
+
+        Args:
+            prefix: Leading characters of the word
+            limit: Maximum suggestions to return (capped at MAX_SUGGESTIONS)
+            order: "frequency" (most frequent first) or "alphabetical" (Tamil alphabet order)
+
+        Returns:
+            List of {"word_text", "count"} dicts
+        """
+        words, counts, alphabet_ranks, memo = self._snapshot
+        memo_key = (prefix, order)
+        suggestions = memo.get(memo_key)
+        if suggestions is None:
+            suggestions = self._rank(words, counts, alphabet_ranks, prefix, order)
+            memo.set(memo_key, suggestions)
+        return suggestions[:min(limit, MAX_SUGGESTIONS)]
+
+    @staticmethod
+    def _rank(words: List[str], counts: List[int], alphabet_ranks: List[int],
+              prefix: str, order: str) -> List[Dict]:
+        """Top MAX_SUGGESTIONS words in the prefix's range of the sorted arrays"""
+        lo = bisect_left(words, prefix)
+        hi = bisect_left(words, prefix + PREFIX_END, lo)
+
+        if order == "alphabetical":
+            indexes = heapq.nsmallest(MAX_SUGGESTIONS, range(lo, hi), key=alphabet_ranks.__getitem__)
+        else:
+            indexes = heapq.nlargest(MAX_SUGGESTIONS, range(lo, hi), key=counts.__getitem__)
+
+        return [{"word_text": words[i], "count": counts[i]} for i in indexes]
+
+    def stats(self) -> Dict:
+        words, _, _, memo = self._snapshot
+        return {
+            "words": len(words),
+            "generation": self.generation,
+            "loaded_at": self.loaded_at,
+            "load_ms": round(self.load_ms, 1),
+            "memo": memo.stats(),
+        }
@@ -0,0 +1,51 @@
+"""
+Tamil grapheme-cluster keys for match_type=grapheme
+
+The one implementation of split_tamil_graphemes and grapheme_key: the API keys
+query terms with it, and scripts/word_cleaning.py imports it to compute the keys
+stored in word_graphemes (the backend is deployed without scripts/).
+"""
+import unicodedata
+from typing import List
+
+# Vowel signs (U+0BBE-U+0BCC), pulli (U+0BCD) and the au length mark (U+0BD7)
+# combine with the preceding letter into one grapheme (uyirmei / mei)
+TAMIL_COMBINING_MARKS = frozenset(chr(code) for code in range(0x0BBE, 0x0BCE)) | {"\u0BD7"}
+GRAPHEME_SEPARATOR = "|"
+
+
+def split_tamil_graphemes(word: str) -> List[str]:
+    """
+    Split a Tamil word into grapheme clusters (letters as a reader counts them)
+
+    Examples:
+        "அறம்" → ["அ", "ற", "ம்"]
+        "கோவில்" → ["கோ", "வி", "ல்"]
+        "வான்-நிலா" → ["வா", "ன்", "-", "நி", "லா"]
+    """
+    graphemes = []
+    for char in word:
+        if graphemes and char in TAMIL_COMBINING_MARKS:
+            graphemes[-1] += char
+        else:
+            graphemes.append(char)
+    return graphemes
+
+
+def grapheme_key(word: str) -> str:
+    """
+    Grapheme-cluster search key: every grapheme of the NFC form of word enclosed
+    in GRAPHEME_SEPARATOR
+
+    LIKE on the key only matches whole graphemes: "|க|%" finds words starting with
+    the letter க, but not கா, கி or க். NFC makes a two-part vowel sign typed as
+    its parts ("ெ" + "ா") key the same as the precomposed sign ("ொ").
+
+    Examples:
+        "அறம்" → "|அ|ற|ம்|"
+        "கோல்" → "|கோ|ல்|"
+    """
+    return GRAPHEME_SEPARATOR + "".join(
+        grapheme + GRAPHEME_SEPARATOR
+        for grapheme in split_tamil_graphemes(unicodedata.normalize("NFC", word))
+    )
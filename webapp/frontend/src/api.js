@@ -17,6 +17,20 @@ const getApiBaseUrl = () => {
 
 const API_BASE_URL = getApiBaseUrl()
 
+/**
+ * Rebuild full search result rows from a format=compact response
+ * (occurrence -> line -> verse -> work lookups by id)
+ */
+const expandCompactSearch = (data) => {
+  const { occurrences, lines, verses, works, format, ...rest } = data
+  const results = occurrences.map(occurrence => {
+    const line = lines[occurrence.line_id]
+    const verse = verses[line.verse_id]
+    return { ...occurrence, ...line, ...verse, ...works[verse.work_id] }
+  })
+  return { ...rest, results }
+}
+
 const api = axios.create({
   baseURL: API_BASE_URL,
   timeout: 10000,
@@ -35,9 +49,53 @@ export default {
 
   /**
    * Search for words
+   * With { compact: true } the page is fetched as format=compact (works, verses and
+   * lines sent once) and expanded back into the usual `results` rows
+   */
+  searchWords(params, { compact = false } = {}) {
+    if (!compact) {
+      return api.get('/search', { params })
+    }
+    return api.get('/search', { params: { ...params, format: 'compact' } }).then(response => {
+      response.data = expandCompactSearch(response.data)
+      return response
+    })
+  },
+
+  /**
+   * Matching words with counts and work breakdown only (no occurrences)
+   */
+  searchSummary(params) {
+    return api.get('/search/summary', { params })
+  },
+
+  /**
+   * Verses containing all / any / none of several words (comma-separated), cursor paged
+   */
+  searchVerses(params) {
+    return api.get('/search/verses', { params })
+  },
+
+  /**
+   * Occurrences of one word, cursor paged (no unique_words / total_count)
+   * Accepts the same options as searchWords
+   */
+  getWordOccurrences(wordText, params = {}, { compact = false } = {}) {
+    const url = `/words/${encodeURIComponent(wordText)}/occurrences`
+    if (!compact) {
+      return api.get(url, { params })
+    }
+    return api.get(url, { params: { ...params, format: 'compact' } }).then(response => {
+      response.data = expandCompactSearch(response.data)
+      return response
+    })
+  },
+
+  /**
+   * Autocomplete: words starting with prefix (most frequent first)
    */
-  searchWords(params) {
-    return api.get('/search', { params })
+  suggestWords(prefix, limit = 10) {
+    return api.get('/suggest', { params: { prefix, limit } })
   },
 
   /**